@@ -1,13 +1,8 @@
 import argparse
 import logging
-from src.server.config import MCP_HOST, MCP_PORT, GCP_PROJECT_ID, GCP_CREDENTIALS_PATH, LOG_LEVEL
-from src.server.mcpserver import MCPServer
+from src.server.config import MCP_HOST, MCP_PORT, GCP_PROJECT_ID, GCP_CREDENTIALS_PATH
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured once by src.server.config
 logger = logging.getLogger(__name__)
 
 def main():
@@ -30,7 +25,10 @@ def main():
         logger.error("GCP Project ID is required. Set it with GCP_PROJECT_ID environment variable or --project flag.")
         return
         
-    logger.info(f"Starting MCP server with project: {project_id}")
+    logger.info("Starting MCP server with project: %s", project_id)
+    
+    # Imported here so --help and config errors skip loading the Google API clients
+    from src.server.mcpserver import MCPServer
     
     # Create server
     server = MCPServer(project_id=project_id, credentials_path=credentials_path)
@@ -0,0 +1,73 @@
+"""
+Credential loading shared by the GCP and GKE services.
+"""
+import datetime
+import logging
+import threading
+import time
+from typing import Dict
+
+import google.auth.transport.requests
+from google.oauth2 import service_account
+
+logger = logging.getLogger(__name__)
+
+SCOPES = ('https://www.googleapis.com/auth/cloud-platform',)
+
+# Refresh the access token this long before it expires
+REFRESH_MARGIN = datetime.timedelta(minutes=5)
+# Delay before retrying a failed background refresh
+REFRESH_RETRY_SECONDS = 60
+
+# Credentials loaded so far, keyed by path. Never evicted: each entry owns a
+# refresh thread that runs for the life of the process.
+_credentials: Dict[str, service_account.Credentials] = {}
+_credentials_lock = threading.Lock()
+
+
+def load_credentials(credentials_path: str) -> service_account.Credentials:
+    """
+    Load service account credentials once per path and keep them fresh.
+
+    The parsed credentials are cached so every service using the same key file
+    shares one object, and a daemon thread refreshes the access token ahead of
+    expiry so no request has to block on token acquisition.
+
+    Args:
+        credentials_path: Path to the service account JSON file
+
+    Returns:
+        service_account.Credentials: The shared credentials object
+    """
+    with _credentials_lock:
+        credentials = _credentials.get(credentials_path)
+        if credentials is not None:
+            return credentials
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path,
+            scopes=list(SCOPES)
+        )
+        threading.Thread(
+            target=_refresh_loop,
+            args=(credentials,),
+            name="gcp-token-refresh",
+            daemon=True
+        ).start()
+        _credentials[credentials_path] = credentials
+        return credentials
+
+
+def _refresh_loop(credentials: service_account.Credentials):
+    """Refresh the credentials' token shortly before each expiry."""
+    request = google.auth.transport.requests.Request()
+    while True:
+        try:
+            credentials.refresh(request)
+        except Exception as e:
+            logger.warning("Background token refresh failed: %s", e)
+            time.sleep(REFRESH_RETRY_SECONDS)
+            continue
+
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        delay = (credentials.expiry - now - REFRESH_MARGIN).total_seconds()
+        time.sleep(max(delay, REFRESH_RETRY_SECONDS))
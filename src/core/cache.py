@@ -0,0 +1,126 @@
+"""
+In-process caching helpers shared by the GCP and GKE services.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Small thread-safe cache whose entries expire a fixed time after being stored.
+
+    Concurrent misses for the same key are coalesced: the first caller runs
+    the loader and the others wait for its result instead of loading again.
+    
+    Entries are kept in the order they were stored, which is also the order
+    they expire in, so expired entries are pruned from the front on each store
+    and the cache only ever holds roughly one TTL's worth of keys.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Number of seconds an entry stays valid (0 disables caching)
+        """
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader to fill it on a miss.
+
+        Args:
+            key: The cache key
+            loader: Zero-argument callable producing the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        if self.ttl > 0:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = Future()
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                if self._inflight.get(key) is pending:
+                    del self._inflight[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            # Only store the value if the key was not invalidated while loading
+            if self._inflight.get(key) is pending:
+                del self._inflight[key]
+                if self.ttl > 0:
+                    now = time.monotonic()
+                    self._prune(now)
+                    # Re-insert at the end so storage order stays expiry order
+                    self._entries.pop(key, None)
+                    self._entries[key] = (now, value)
+        pending.set_result(value)
+        return value
+
+    def _prune(self, now: float):
+        """Drop the expired entries at the front of the cache. Called with the lock held."""
+        expired = []
+        for key, (stored, _) in self._entries.items():
+            if now - stored < self.ttl:
+                break
+            expired.append(key)
+        for key in expired:
+            del self._entries[key]
+    
+    def peek(self, key: Hashable) -> Any:
+        """
+        Return the cached value for key if it is still fresh, without loading.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        """
+        Drop every entry whose key matches predicate.
+
+        Loads already in flight for a matching key still return to their
+        callers, but their results are not stored.
+
+        Args:
+            predicate: Callable returning True for keys to drop
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+            for key in [key for key in self._inflight if predicate(key)]:
+                del self._inflight[key]
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._inflight.clear()
@@ -1,44 +1,146 @@
 """
 GKE Service implementation for cluster and nodepool management.
 """
+import functools
+import inspect
 import logging
-from typing import Dict, List, Optional, Any, Union
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
-from google.oauth2 import service_account
-from googleapiclient import discovery
+from googleapiclient.errors import HttpError
 
+from src.core.auth import load_credentials
+from src.core.cache import TTLCache
+from src.core.transport import build_service, describe_error
 from src.models.gke_models import GKECluster, NodePool, GKEOperation, NodeTaint
+from src.server.config import GKE_CACHE_TTL, TRUST_GCP_RESPONSES
 
 logger = logging.getLogger(__name__)
 
+# OAuth scopes granted to the nodes of every node pool we create
+_DEFAULT_OAUTH_SCOPES: Tuple[str, ...] = (
+    'https://www.googleapis.com/auth/devstorage.read_only',
+    'https://www.googleapis.com/auth/logging.write',
+    'https://www.googleapis.com/auth/monitoring',
+    'https://www.googleapis.com/auth/servicecontrol',
+    'https://www.googleapis.com/auth/service.management.readonly',
+    'https://www.googleapis.com/auth/trace.append'
+)
+
+# Taint effect assumed when the API omits one
+_DEFAULT_TAINT_EFFECT = 'NO_SCHEDULE'
+
+# Shared read-only stand-in for missing nested objects in API responses
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Constructors for models built from API responses; validation is skipped when trusted
+_new_cluster = GKECluster.model_construct if TRUST_GCP_RESPONSES else GKECluster
+_new_node_pool = NodePool.model_construct if TRUST_GCP_RESPONSES else NodePool
+_new_taint = NodeTaint.model_construct if TRUST_GCP_RESPONSES else NodeTaint
+
+# Resource collections resolved by initialize() on first use
+_LAZY_COLLECTIONS = frozenset((
+    '_zonal_clusters',
+    '_regional_clusters',
+    '_zonal_node_pools',
+    '_regional_node_pools',
+))
+
+
+def _logged(action: str):
+    """
+    Log and re-raise any exception escaping the decorated GKEService method.
+    
+    Args:
+        action: Description of the operation, formatted with the method's
+            arguments by name (e.g. "deleting cluster {name}")
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                logger.error("Error %s: %s", action.format(**bound.arguments), describe_error(e))
+                raise
+        return wrapper
+    return decorator
+
 class GKEService:
     """
     Service for interacting with GKE API.
     Handles authentication and provides methods for managing GKE clusters and nodepools.
     """
     
-    def __init__(self, project_id: str, credentials_path: str):
+    __slots__ = (
+        'project_id',
+        '_project_prefix',
+        'credentials_path',
+        'container_service',
+        '_zonal_clusters',
+        '_regional_clusters',
+        '_zonal_node_pools',
+        '_regional_node_pools',
+        '_cache',
+    )
+    
+    # Container API clients shared by every GKEService using the same credentials
+    _shared_container_services: Dict[str, Any] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, project_id: str, credentials_path: str, cache_ttl: float = GKE_CACHE_TTL):
         """Initialize the GKE service with project ID and credentials."""
         if not project_id:
             raise ValueError("GCP_PROJECT_ID environment variable is required")
         
         self.project_id = project_id
+        # Common prefix of every resource name used with the locations API
+        self._project_prefix = f"projects/{project_id}"
         self.credentials_path = credentials_path
         self.container_service = None
+        # The resource collection slots stay unset until initialize() fills them
+        # Cached cluster and node pool reads, keyed on (location, method, name)
+        self._cache = TTLCache(cache_ttl)
         
     def initialize(self):
-        """Initialize the container service with credentials."""
+        """Initialize the container service with credentials. Safe to call more than once."""
+        if self.container_service is not None:
+            return
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=['https://www.googleapis.com/auth/cloud-platform']
-            )
-            self.container_service = discovery.build('container', 'v1', credentials=credentials)
-            logger.info(f"GKE service initialized for project: {self.project_id}")
+            with GKEService._shared_lock:
+                # Re-check under the lock so concurrent first calls initialize only once
+                if self.container_service is not None:
+                    return
+                container_service = GKEService._shared_container_services.get(self.credentials_path)
+                if container_service is None:
+                    credentials = load_credentials(self.credentials_path)
+                    container_service = build_service('container', 'v1', credentials)
+                    GKEService._shared_container_services[self.credentials_path] = container_service
+                
+                # Resolve the resource chains once instead of on every call
+                self._zonal_clusters = container_service.projects().zones().clusters()
+                self._regional_clusters = container_service.projects().locations().clusters()
+                self._zonal_node_pools = self._zonal_clusters.nodePools()
+                self._regional_node_pools = self._regional_clusters.nodePools()
+                # Set last: a non-None client means the collections are ready
+                self.container_service = container_service
+            logger.info("GKE service initialized for project: %s", self.project_id)
         except Exception as e:
-            logger.error(f"Failed to initialize GKE service: {e}")
+            logger.error("Failed to initialize GKE service: %s", describe_error(e))
             raise
     
+    def __getattr__(self, name: str) -> Any:
+        """Initialize on first use of a resource collection (only called while its slot is unset)."""
+        if name in _LAZY_COLLECTIONS:
+            self.initialize()
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
     def list_clusters(self, location: Optional[str] = None) -> List[GKECluster]:
         """
         List all GKE clusters in the specified location or across all locations.
@@ -49,36 +151,29 @@ class GKEService:
         Returns:
             List[GKECluster]: List of GKE clusters
         """
-        try:
-            if location:
-                # Check if location is a zone or region
-                if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                    result = self.container_service.projects().zones().clusters().list(
-                        projectId=self.project_id,
-                        zone=location
-                    ).execute()
-                else:  # region
-                    result = self.container_service.projects().locations().clusters().list(
-                        parent=f"projects/{self.project_id}/locations/{location}"
-                    ).execute()
-            else:
-                # List clusters across all locations
-                result = self.container_service.projects().aggregated().clusters().list(
-                    parent=f"projects/{self.project_id}"
+        return self._cached((location, 'list_clusters', None), lambda: self._fetch_clusters(location))
+    
+    @_logged("listing GKE clusters in location {location}")
+    def _fetch_clusters(self, location: Optional[str]) -> List[GKECluster]:
+        """Fetch the cluster list from the API, bypassing the cache."""
+        if location:
+            # Check if location is a zone or region
+            if self._is_zone(location):  # e.g., us-central1-a
+                result = self._zonal_clusters.list(
+                    projectId=self.project_id,
+                    zone=location
                 ).execute()
-            
-            clusters = []
-            
-            # Process the result based on which API was used
-            if 'clusters' in result:
-                for item in result.get('clusters', []):
-                    cluster = self._cluster_dict_to_model(item)
-                    clusters.append(cluster)
-            
-            return clusters
-        except Exception as e:
-            logger.error(f"Error listing GKE clusters in location {location}: {e}")
-            raise
+            else:  # region
+                result = self._regional_clusters.list(
+                    parent=f"{self._project_prefix}/locations/{location}"
+                ).execute()
+        else:
+            # List clusters across all locations ("-" is the location wildcard)
+            result = self._regional_clusters.list(
+                parent=f"{self._project_prefix}/locations/-"
+            ).execute()
+        
+        return [self._cluster_dict_to_model(item) for item in result.get('clusters', [])]
     
     def get_cluster(self, name: str, location: str) -> Optional[GKECluster]:
         """
@@ -91,27 +186,32 @@ class GKEService:
         Returns:
             GKECluster: The cluster if found, None otherwise
         """
+        return self._cached((location, 'get_cluster', name), lambda: self._fetch_cluster(name, location))
+    
+    @_logged("getting cluster {name} in location {location}")
+    def _fetch_cluster(self, name: str, location: str) -> Optional[GKECluster]:
+        """Fetch a single cluster from the API, bypassing the cache."""
         try:
             # Check if location is a zone or region
-            if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                result = self.container_service.projects().zones().clusters().get(
+            if self._is_zone(location):  # e.g., us-central1-a
+                result = self._zonal_clusters.get(
                     projectId=self.project_id,
                     zone=location,
                     clusterId=name
                 ).execute()
             else:  # region
-                result = self.container_service.projects().locations().clusters().get(
-                    name=f"projects/{self.project_id}/locations/{location}/clusters/{name}"
+                result = self._regional_clusters.get(
+                    name=f"{self._project_prefix}/locations/{location}/clusters/{name}"
                 ).execute()
             
             return self._cluster_dict_to_model(result)
-        except Exception as e:
-            if "not found" in str(e).lower():
-                logger.warning(f"Cluster {name} not found in location {location}")
+        except HttpError as e:
+            if e.resp.status == 404:
+                logger.warning("Cluster %s not found in location %s", name, location)
                 return None
-            logger.error(f"Error getting cluster {name} in location {location}: {e}")
             raise
     
+    @_logged("creating cluster {cluster.name}")
     def create_cluster(self, cluster: GKECluster) -> GKEOperation:
         """
         Create a new GKE cluster.
@@ -122,42 +222,41 @@ class GKEService:
         Returns:
             GKEOperation: The result of the create operation
         """
-        try:
-            # Build the cluster configuration
-            cluster_config = self._build_cluster_config(cluster)
+        self._invalidate(cluster.location)
+        
+        # Build the cluster configuration
+        cluster_config = self._build_cluster_config(cluster)
+        
+        # Choose the appropriate API based on location type
+        if cluster.is_regional:
+            operation = self._regional_clusters.create(
+                parent=f"{self._project_prefix}/locations/{cluster.location}",
+                body=cluster_config
+            ).execute()
             
-            # Choose the appropriate API based on location type
-            if cluster.is_regional:
-                operation = self.container_service.projects().locations().clusters().create(
-                    parent=f"projects/{self.project_id}/locations/{cluster.location}",
-                    body=cluster_config
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='create',
-                    target_id=cluster.name,
-                    region=cluster.location
-                )
-            else:
-                operation = self.container_service.projects().zones().clusters().create(
-                    projectId=self.project_id,
-                    zone=cluster.location,
-                    body=cluster_config
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='create',
-                    target_id=cluster.name,
-                    zone=cluster.location
-                )
-        except Exception as e:
-            logger.error(f"Error creating cluster {cluster.name}: {e}")
-            raise
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='create',
+                target_id=cluster.name,
+                region=cluster.location
+            )
+        else:
+            operation = self._zonal_clusters.create(
+                projectId=self.project_id,
+                zone=cluster.location,
+                body=cluster_config
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='create',
+                target_id=cluster.name,
+                zone=cluster.location
+            )
     
+    @_logged("deleting cluster {name}")
     def delete_cluster(self, name: str, location: str) -> GKEOperation:
         """
         Delete a GKE cluster.
@@ -169,37 +268,35 @@ class GKEService:
         Returns:
             GKEOperation: The result of the delete operation
         """
-        try:
-            # Check if location is a zone or region
-            if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                operation = self.container_service.projects().zones().clusters().delete(
-                    projectId=self.project_id,
-                    zone=location,
-                    clusterId=name
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='delete',
-                    target_id=name,
-                    zone=location
-                )
-            else:  # region
-                operation = self.container_service.projects().locations().clusters().delete(
-                    name=f"projects/{self.project_id}/locations/{location}/clusters/{name}"
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='delete',
-                    target_id=name,
-                    region=location
-                )
-        except Exception as e:
-            logger.error(f"Error deleting cluster {name}: {e}")
-            raise
+        self._invalidate(location)
+        
+        # Check if location is a zone or region
+        if self._is_zone(location):  # e.g., us-central1-a
+            operation = self._zonal_clusters.delete(
+                projectId=self.project_id,
+                zone=location,
+                clusterId=name
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='delete',
+                target_id=name,
+                zone=location
+            )
+        else:  # region
+            operation = self._regional_clusters.delete(
+                name=f"{self._project_prefix}/locations/{location}/clusters/{name}"
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='delete',
+                target_id=name,
+                region=location
+            )
     
     def list_node_pools(self, cluster_name: str, location: str) -> List[NodePool]:
         """
@@ -212,29 +309,53 @@ class GKEService:
         Returns:
             List[NodePool]: List of node pools in the cluster
         """
-        try:
-            # Check if location is a zone or region
-            if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                result = self.container_service.projects().zones().clusters().nodePools().list(
-                    projectId=self.project_id,
-                    zone=location,
-                    clusterId=cluster_name
-                ).execute()
-            else:  # region
-                result = self.container_service.projects().locations().clusters().nodePools().list(
-                    parent=f"projects/{self.project_id}/locations/{location}/clusters/{cluster_name}"
-                ).execute()
-            
-            node_pools = []
-            for item in result.get('nodePools', []):
-                node_pool = self._node_pool_dict_to_model(item)
-                node_pools.append(node_pool)
-            
-            return node_pools
-        except Exception as e:
-            logger.error(f"Error listing node pools for cluster {cluster_name} in location {location}: {e}")
-            raise
+        return self._cached(
+            (location, 'list_node_pools', cluster_name),
+            lambda: self._fetch_node_pools(cluster_name, location)
+        )
     
+    @_logged("listing node pools for cluster {cluster_name} in location {location}")
+    def _fetch_node_pools(self, cluster_name: str, location: str) -> List[NodePool]:
+        """Fetch a cluster's node pools from the API, bypassing the cache."""
+        # Check if location is a zone or region
+        if self._is_zone(location):  # e.g., us-central1-a
+            result = self._zonal_node_pools.list(
+                projectId=self.project_id,
+                zone=location,
+                clusterId=cluster_name
+            ).execute()
+        else:  # region
+            result = self._regional_node_pools.list(
+                parent=f"{self._project_prefix}/locations/{location}/clusters/{cluster_name}"
+            ).execute()
+        
+        node_pools = []
+        for item in result.get('nodePools', []):
+            node_pool = self._node_pool_dict_to_model(item)
+            node_pools.append(node_pool)
+        
+        return node_pools
+
+    def get_cluster_with_node_pools(self, name: str, location: str) -> Tuple[Optional[GKECluster], List[NodePool]]:
+        """
+        Get a cluster together with its node pools.
+
+        The cluster resource already embeds its node pools, so this takes a
+        single request.
+
+        Args:
+            name: The name of the cluster
+            location: The zone or region where the cluster is located
+
+        Returns:
+            The cluster (None if not found) and its node pools
+        """
+        cluster = self.get_cluster(name, location)
+        if cluster is None:
+            return None, []
+        return cluster, cluster.node_pools
+
+    @_logged("creating node pool {node_pool.name} in cluster {cluster_name}")
     def create_node_pool(self, cluster_name: str, location: str, node_pool: NodePool) -> GKEOperation:
         """
         Create a new node pool in an existing GKE cluster.
@@ -247,43 +368,42 @@ class GKEService:
         Returns:
             GKEOperation: The result of the create operation
         """
-        try:
-            # Build the node pool configuration
-            node_pool_config = self._build_node_pool_config(node_pool)
+        self._invalidate(location)
+        
+        # Build the node pool configuration
+        node_pool_config = self._build_node_pool_config(node_pool)
+        
+        # Choose the appropriate API based on location type
+        if self._is_zone(location):  # e.g., us-central1-a
+            operation = self._zonal_node_pools.create(
+                projectId=self.project_id,
+                zone=location,
+                clusterId=cluster_name,
+                body=node_pool_config
+            ).execute()
             
-            # Choose the appropriate API based on location type
-            if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                operation = self.container_service.projects().zones().clusters().nodePools().create(
-                    projectId=self.project_id,
-                    zone=location,
-                    clusterId=cluster_name,
-                    body=node_pool_config
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='create_node_pool',
-                    target_id=node_pool.name,
-                    zone=location
-                )
-            else:  # region
-                operation = self.container_service.projects().locations().clusters().nodePools().create(
-                    parent=f"projects/{self.project_id}/locations/{location}/clusters/{cluster_name}",
-                    body=node_pool_config
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='create_node_pool',
-                    target_id=node_pool.name,
-                    region=location
-                )
-        except Exception as e:
-            logger.error(f"Error creating node pool {node_pool.name} in cluster {cluster_name}: {e}")
-            raise
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='create_node_pool',
+                target_id=node_pool.name,
+                zone=location
+            )
+        else:  # region
+            operation = self._regional_node_pools.create(
+                parent=f"{self._project_prefix}/locations/{location}/clusters/{cluster_name}",
+                body=node_pool_config
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='create_node_pool',
+                target_id=node_pool.name,
+                region=location
+            )
     
+    @_logged("deleting node pool {node_pool_name} from cluster {cluster_name}")
     def delete_node_pool(self, cluster_name: str, location: str, node_pool_name: str) -> GKEOperation:
         """
         Delete a node pool from a GKE cluster.
@@ -296,39 +416,38 @@ class GKEService:
         Returns:
             GKEOperation: The result of the delete operation
         """
-        try:
-            # Check if location is a zone or region
-            if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                operation = self.container_service.projects().zones().clusters().nodePools().delete(
-                    projectId=self.project_id,
-                    zone=location,
-                    clusterId=cluster_name,
-                    nodePoolId=node_pool_name
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='delete_node_pool',
-                    target_id=node_pool_name,
-                    zone=location
-                )
-            else:  # region
-                operation = self.container_service.projects().locations().clusters().nodePools().delete(
-                    name=f"projects/{self.project_id}/locations/{location}/clusters/{cluster_name}/nodePools/{node_pool_name}"
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='delete_node_pool',
-                    target_id=node_pool_name,
-                    region=location
-                )
-        except Exception as e:
-            logger.error(f"Error deleting node pool {node_pool_name} from cluster {cluster_name}: {e}")
-            raise
+        self._invalidate(location)
+        
+        # Check if location is a zone or region
+        if self._is_zone(location):  # e.g., us-central1-a
+            operation = self._zonal_node_pools.delete(
+                projectId=self.project_id,
+                zone=location,
+                clusterId=cluster_name,
+                nodePoolId=node_pool_name
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='delete_node_pool',
+                target_id=node_pool_name,
+                zone=location
+            )
+        else:  # region
+            operation = self._regional_node_pools.delete(
+                name=f"{self._project_prefix}/locations/{location}/clusters/{cluster_name}/nodePools/{node_pool_name}"
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='delete_node_pool',
+                target_id=node_pool_name,
+                region=location
+            )
     
+    @_logged("resizing node pool {node_pool_name} in cluster {cluster_name}")
     def resize_node_pool(self, cluster_name: str, location: str, node_pool_name: str, node_count: int) -> GKEOperation:
         """
         Resize a node pool in a GKE cluster.
@@ -342,44 +461,81 @@ class GKEService:
         Returns:
             GKEOperation: The result of the resize operation
         """
-        try:
-            # Check if location is a zone or region
-            if '-' in location.split('-')[-1]:  # e.g., us-central1-a
-                operation = self.container_service.projects().zones().clusters().nodePools().setSize(
-                    projectId=self.project_id,
-                    zone=location,
-                    clusterId=cluster_name,
-                    nodePoolId=node_pool_name,
-                    body={
-                        'nodeCount': node_count
-                    }
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='resize_node_pool',
-                    target_id=node_pool_name,
-                    zone=location
-                )
-            else:  # region
-                operation = self.container_service.projects().locations().clusters().nodePools().setSize(
-                    name=f"projects/{self.project_id}/locations/{location}/clusters/{cluster_name}/nodePools/{node_pool_name}",
-                    body={
-                        'nodeCount': node_count
-                    }
-                ).execute()
-                
-                return GKEOperation(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='resize_node_pool',
-                    target_id=node_pool_name,
-                    region=location
-                )
-        except Exception as e:
-            logger.error(f"Error resizing node pool {node_pool_name} in cluster {cluster_name}: {e}")
-            raise
+        self._invalidate(location)
+        
+        # Check if location is a zone or region
+        if self._is_zone(location):  # e.g., us-central1-a
+            operation = self._zonal_node_pools.setSize(
+                projectId=self.project_id,
+                zone=location,
+                clusterId=cluster_name,
+                nodePoolId=node_pool_name,
+                body={
+                    'nodeCount': node_count
+                }
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='resize_node_pool',
+                target_id=node_pool_name,
+                zone=location
+            )
+        else:  # region
+            operation = self._regional_node_pools.setSize(
+                name=f"{self._project_prefix}/locations/{location}/clusters/{cluster_name}/nodePools/{node_pool_name}",
+                body={
+                    'nodeCount': node_count
+                }
+            ).execute()
+            
+            return GKEOperation(
+                name=operation.get('name', ''),
+                status=operation.get('status', ''),
+                operation_type='resize_node_pool',
+                target_id=node_pool_name,
+                region=location
+            )
+    
+    @staticmethod
+    def _is_zone(location: str) -> bool:
+        """Return True if location is a zone, False if it is a region."""
+        # Zones are a region plus a zone letter (us-central1-a); regions have one dash (us-central1)
+        return location.count('-') == 2
+    
+    def _cached(self, key: Tuple[Optional[str], str, Optional[str]], fetch: Callable[[], Any]) -> Any:
+        """
+        Serve a read from the TTL cache, calling fetch on a miss.
+        
+        Args:
+            key: The (location, method, name) cache key
+            fetch: Zero-argument callable that performs the API read
+            
+        Returns:
+            The cached or freshly fetched result
+        """
+        return self._cache.get_or_load(key, fetch)
+    
+    def _invalidate(self, location: str):
+        """
+        Drop cached reads that a write in the given location may have made stale.
+        
+        Covers the location itself, the region/zones it overlaps with, and the
+        project-wide cluster listing.
+        
+        Args:
+            location: The zone or region being modified
+        """
+        def affected(key):
+            cached_location = key[0]
+            return (
+                cached_location is None
+                or cached_location.startswith(location)
+                or location.startswith(cached_location)
+            )
+        
+        self._cache.invalidate_where(affected)
     
     def _build_cluster_config(self, cluster: GKECluster) -> Dict[str, Any]:
         """
@@ -400,14 +556,36 @@ class GKEService:
             config['autopilot'] = {
                 'enabled': True
             }
-        else:
-            # Add node pools for standard clusters
-            config['nodePools'] = [
-                self._build_node_pool_config(pool)
-                for pool in cluster.node_pools
-            ]
+        elif cluster.node_pools:
+            # Add node pools for standard clusters; without any, the API default pool applies
+            build_node_pool = self._build_node_pool_config
+            config['nodePools'] = [build_node_pool(pool) for pool in cluster.node_pools]
         
         # Add networking configuration if specified
+        network_config = self._build_network_config(cluster)
+        if network_config:
+            config['networkConfig'] = network_config
+        
+        # Add Kubernetes version if specified
+        if cluster.kubernetes_version:
+            config['initialClusterVersion'] = cluster.kubernetes_version
+        
+        return config
+    
+    def _build_network_config(self, cluster: GKECluster) -> Optional[Dict[str, Any]]:
+        """
+        Build the network configuration dictionary from a GKECluster model.
+        
+        Args:
+            cluster: The GKECluster object
+            
+        Returns:
+            Optional[Dict[str, Any]]: The network configuration, or None if no network options are set
+        """
+        if not (cluster.cluster_ipv4_cidr or cluster.services_ipv4_cidr or cluster.network
+                or cluster.subnetwork or cluster.private_cluster):
+            return None
+        
         network_config = {}
         
         if cluster.cluster_ipv4_cidr:
@@ -430,15 +608,7 @@ class GKEService:
                 'masterIpv4CidrBlock': cluster.master_ipv4_cidr_block
             }
         
-        # Add network configuration to the cluster config if any options were set
-        if network_config:
-            config['networkConfig'] = network_config
-        
-        # Add Kubernetes version if specified
-        if cluster.kubernetes_version:
-            config['initialClusterVersion'] = cluster.kubernetes_version
-        
-        return config
+        return network_config
     
     def _build_node_pool_config(self, node_pool: NodePool) -> Dict[str, Any]:
         """
@@ -457,14 +627,8 @@ class GKEService:
                 'machineType': node_pool.machine_type,
                 'diskSizeGb': node_pool.disk_size_gb,
                 'diskType': node_pool.disk_type,
-                'oauthScopes': [
-                    'https://www.googleapis.com/auth/devstorage.read_only',
-                    'https://www.googleapis.com/auth/logging.write',
-                    'https://www.googleapis.com/auth/monitoring',
-                    'https://www.googleapis.com/auth/servicecontrol',
-                    'https://www.googleapis.com/auth/service.management.readonly',
-                    'https://www.googleapis.com/auth/trace.append'
-                ]
+                # A fresh list per config, since callers may extend it
+                'oauthScopes': list(_DEFAULT_OAUTH_SCOPES)
             },
             'maxPodsConstraint': {
                 'maxPodsPerNode': str(node_pool.max_pods_per_node)
@@ -514,39 +678,39 @@ class GKEService:
         Returns:
             GKECluster: The cluster model
         """
+        get = cluster_dict.get
+        
         # Determine location and location type
-        location = cluster_dict.get('location', '')
-        location_type = 'regional' if location and not location.endswith('-a') else 'zonal'
+        location = get('location', '')
+        location_type = 'regional' if location and not self._is_zone(location) else 'zonal'
         
         # Extract network configuration
-        network_config = cluster_dict.get('networkConfig', {})
-        private_cluster_config = cluster_dict.get('privateClusterConfig', {})
+        network_get = (get('networkConfig') or _EMPTY).get
+        private_cluster_config = get('privateClusterConfig') or _EMPTY
+        private_get = private_cluster_config.get
         
         # Determine if autopilot is enabled
-        autopilot = cluster_dict.get('autopilot', {}).get('enabled', False)
+        autopilot = (get('autopilot') or _EMPTY).get('enabled', False)
         
         # Extract node pools
-        node_pools = []
-        for np in cluster_dict.get('nodePools', []):
-            node_pool = self._node_pool_dict_to_model(np)
-            node_pools.append(node_pool)
+        to_node_pool = self._node_pool_dict_to_model
+        node_pools = [to_node_pool(np) for np in get('nodePools') or ()]
         
-        # Create and return the GKECluster model
-        return GKECluster(
-            name=cluster_dict.get('name', ''),
+        return _new_cluster(
+            name=get('name', ''),
             location=location,
             location_type=location_type,
             autopilot=autopilot,
             node_pools=node_pools,
-            cluster_ipv4_cidr=network_config.get('clusterIpv4Cidr'),
-            services_ipv4_cidr=network_config.get('servicesIpv4Cidr'),
+            cluster_ipv4_cidr=network_get('clusterIpv4Cidr'),
+            services_ipv4_cidr=network_get('servicesIpv4Cidr'),
             private_cluster=bool(private_cluster_config),
-            network=network_config.get('network'),
-            subnetwork=network_config.get('subnetwork'),
-            enable_private_nodes=private_cluster_config.get('enablePrivateNodes', False),
-            enable_private_endpoint=private_cluster_config.get('enablePrivateEndpoint', False),
-            master_ipv4_cidr_block=private_cluster_config.get('masterIpv4CidrBlock'),
-            kubernetes_version=cluster_dict.get('currentMasterVersion')
+            network=network_get('network'),
+            subnetwork=network_get('subnetwork'),
+            enable_private_nodes=private_get('enablePrivateNodes', False),
+            enable_private_endpoint=private_get('enablePrivateEndpoint', False),
+            master_ipv4_cidr_block=private_get('masterIpv4CidrBlock'),
+            kubernetes_version=get('currentMasterVersion')
         )
     
     def _node_pool_dict_to_model(self, node_pool_dict: Dict[str, Any]) -> NodePool:
@@ -559,35 +723,37 @@ class GKEService:
         Returns:
             NodePool: The node pool model
         """
+        get = node_pool_dict.get
+        
         # Extract node config
-        config = node_pool_dict.get('config', {})
+        config_get = (get('config') or _EMPTY).get
         
         # Extract autoscaling config
-        autoscaling = node_pool_dict.get('autoscaling', {})
-        autoscaling_enabled = autoscaling.get('enabled', False)
+        autoscaling_get = (get('autoscaling') or _EMPTY).get
+        autoscaling_enabled = autoscaling_get('enabled', False)
         
         # Extract taints
-        taints = []
-        for taint_dict in config.get('taints', []):
-            taints.append(NodeTaint(
-                key=taint_dict.get('key', ''),
-                value=taint_dict.get('value', ''),
-                effect=taint_dict.get('effect', 'NO_SCHEDULE')
-            ))
-        
-        # Create and return the NodePool model
-        return NodePool(
-            name=node_pool_dict.get('name', ''),
-            node_count=node_pool_dict.get('initialNodeCount', 0),
-            machine_type=config.get('machineType', 'e2-standard-2'),
-            disk_size_gb=config.get('diskSizeGb', 100),
-            disk_type=config.get('diskType', 'pd-standard'),
-            max_pods_per_node=int(node_pool_dict.get('maxPodsConstraint', {}).get('maxPodsPerNode', 110)),
-            network_tags=config.get('tags', []),
-            kubernetes_labels=config.get('labels', {}),
-            labels=node_pool_dict.get('resourceLabels', {}),
+        taints = [
+            _new_taint(
+                key=taint.get('key', ''),
+                value=taint.get('value', ''),
+                effect=taint.get('effect', _DEFAULT_TAINT_EFFECT)
+            )
+            for taint in config_get('taints') or ()
+        ]
+        
+        return _new_node_pool(
+            name=get('name', ''),
+            node_count=get('initialNodeCount', 0),
+            machine_type=config_get('machineType', 'e2-standard-2'),
+            disk_size_gb=config_get('diskSizeGb', 100),
+            disk_type=config_get('diskType', 'pd-standard'),
+            max_pods_per_node=int((get('maxPodsConstraint') or _EMPTY).get('maxPodsPerNode', 110)),
+            network_tags=config_get('tags', []),
+            kubernetes_labels=config_get('labels', {}),
+            labels=get('resourceLabels', {}),
             taints=taints,
             autoscaling_enabled=autoscaling_enabled,
-            min_node_count=autoscaling.get('minNodeCount') if autoscaling_enabled else None,
-            max_node_count=autoscaling.get('maxNodeCount') if autoscaling_enabled else None
-        )
\ No newline at end of file
+            min_node_count=autoscaling_get('minNodeCount') if autoscaling_enabled else None,
+            max_node_count=autoscaling_get('maxNodeCount') if autoscaling_enabled else None
+        )
@@ -1,43 +1,134 @@
-from typing import Dict, List, Optional, Union, Any
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union, Any
 
 import httpx
 from fastapi import FastAPI
-from google.oauth2 import service_account
-from googleapiclient import discovery
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 from mcp.server.fastmcp import FastMCP
 from mcp.types import Request, Result
 from pydantic import BaseModel, Field
+from src.core.auth import load_credentials
+from src.core.cache import TTLCache
+from src.core.transport import build_service, describe_error
 from src.models.models import GCPInstance, GCPInstanceList, GCPOperationResult
-from src.server.config import logger
+from src.server.config import logger, TRUST_GCP_RESPONSES, GCP_INSTANCE_CACHE_TTL, GCP_LIST_CACHE_TTL, GCP_ZONES_CACHE_TTL
+import sys
+import threading
 import time
 
+# Maximum number of calls Google accepts in one batch HTTP request
+_BATCH_LIMIT = 100
+
+# Maximum number of zones queried at the same time by list_all_zones
+_MAX_FANOUT_CONCURRENCY = 16
+
+# Maximum number of instances whose fingerprints are remembered
+_FINGERPRINT_CACHE_SIZE = 1024
+
+# Partial-response masks for the GETs issued by modify_instance: the fingerprints
+# alone for label/metadata changes, plus the fields update() preserves otherwise
+_FINGERPRINT_FIELDS = 'name,labelFingerprint,metadata/fingerprint'
+_UPDATE_FIELDS = 'name,machineType,networkInterfaces,disks,labels,labelFingerprint,metadata'
+
+# Partial-response masks for instance reads: only what _instance_from_dict keeps
+# (plus the label fingerprint it records), for single instances and list pages
+_INSTANCE_FIELDS = (
+    'name,machineType,status,networkInterfaces(network,networkIP,accessConfigs),'
+    'disks(boot,autoDelete,source),metadata,labels,labelFingerprint'
+)
+_LIST_FIELDS = f'items({_INSTANCE_FIELDS}),nextPageToken'
+
+# Network interface for new instances that do not specify one: the default VPC
+# with an ephemeral external IP. Shared by every request body and never mutated.
+_DEFAULT_NETWORK_INTERFACES = ({
+    'network': 'global/networks/default',
+    'accessConfigs': ({'type': 'ONE_TO_ONE_NAT', 'name': 'External NAT'},)
+},)
+
+
+def _metadata_items(metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a metadata dict into the API's list of key/value items."""
+    return [{'key': key, 'value': value} for key, value in metadata.items()]
+
+
+# Constructors for models built from API responses; validation is skipped when
+# trusted, since the API has already validated the data
+_new_instance = GCPInstance.model_construct if TRUST_GCP_RESPONSES else GCPInstance
+_new_instance_list = GCPInstanceList.model_construct if TRUST_GCP_RESPONSES else GCPInstanceList
+_new_operation_result = GCPOperationResult.model_construct if TRUST_GCP_RESPONSES else GCPOperationResult
+
+
+@functools.lru_cache(maxsize=None)
+def _zone_executor() -> ThreadPoolExecutor:
+    """Return the thread pool used to query zones concurrently, creating it on first use."""
+    return ThreadPoolExecutor(max_workers=_MAX_FANOUT_CONCURRENCY, thread_name_prefix="gcp-zones")
+
+
 class GCPService:
     """
     Service for interacting with GCP Compute Engine API.
     Handles authentication and provides methods for managing instances.
     """
     
-    def __init__(self, project_id: str, credentials_path: str):
+    # Compute API clients shared by every GCPService using the same credentials
+    _shared_compute_services: Dict[str, Any] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, project_id: str, credentials_path: str,
+                 instance_cache_ttl: float = GCP_INSTANCE_CACHE_TTL,
+                 list_cache_ttl: float = GCP_LIST_CACHE_TTL,
+                 zones_cache_ttl: float = GCP_ZONES_CACHE_TTL):
         """Initialize the GCP service with project ID and credentials."""
         if not project_id:
             raise ValueError("GCP_PROJECT_ID environment variable is required")
         
         self.project_id = project_id
+        # Common prefix of every full resource path in the project
+        self._project_prefix = f"projects/{project_id}"
         self.credentials_path = credentials_path
         self.compute_service = None
+        # Resource collections resolved once in initialize()
+        self._instances = None
+        self._disks = None
+        self._zone_operations = None
+        # Label/metadata fingerprints keyed by (zone, name), least recently used first
+        self._fingerprints: OrderedDict = OrderedDict()
+        self._fingerprints_lock = threading.Lock()
+        # Cached reads keyed by (zone, name) and (zone, page_token)
+        self._instance_cache = TTLCache(instance_cache_ttl)
+        self._list_cache = TTLCache(list_cache_ttl)
+        # Names of the project's zones, which change rarely
+        self._zones_cache = TTLCache(zones_cache_ttl)
         
     def initialize(self):
-        """Initialize the compute service with credentials."""
+        """Initialize the compute service with credentials. Safe to call more than once."""
+        if self.compute_service is not None:
+            return
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=['https://www.googleapis.com/auth/cloud-platform']
-            )
-            self.compute_service = discovery.build('compute', 'v1', credentials=credentials)
+            compute_service = GCPService._shared_compute_services.get(self.credentials_path)
+            if compute_service is None:
+                with GCPService._shared_lock:
+                    # Re-check under the lock so concurrent callers build only one client
+                    compute_service = GCPService._shared_compute_services.get(self.credentials_path)
+                    if compute_service is None:
+                        credentials = load_credentials(self.credentials_path)
+                        compute_service = build_service('compute', 'v1', credentials)
+                        GCPService._shared_compute_services[self.credentials_path] = compute_service
+            
+            # Resolve the resource collections once instead of on every call
+            self._instances = compute_service.instances()
+            self._disks = compute_service.disks()
+            self._zone_operations = compute_service.zoneOperations()
+            # Set last: a non-None client means the collections are ready
+            self.compute_service = compute_service
             logger.info(f"GCP service initialized for project: {self.project_id}")
         except Exception as e:
-            logger.error(f"Failed to initialize GCP service: {e}")
+            logger.error(f"Failed to initialize GCP service: {describe_error(e)}")
             raise
+
     def list_instances(self, zone: str, page_token: Optional[str] = None) -> GCPInstanceList:
         """
         List all instances in the specified zone.
@@ -49,55 +140,36 @@ class GCPService:
         Returns:
             GCPInstanceList: List of instances and next page token if any
         """
+        return self._list_cache.get_or_load(
+            (zone, page_token),
+            lambda: self._fetch_instances(zone, page_token)
+        )
+    
+    def _fetch_instances(self, zone: str, page_token: Optional[str]) -> GCPInstanceList:
+        """Fetch one page of instances from the API, bypassing the cache."""
         try:
-            result = self.compute_service.instances().list(
-                project=self.project_id,
-                zone=zone,
-                pageToken=page_token
-            ).execute()
+            result = self._fetch_instance_page(zone, page_token)
             
-            instances = []
-            for item in result.get('items', []):
-                # Extract network interfaces
-                network_interfaces = []
-                for ni in item.get('networkInterfaces', []):
-                    network_interface = {
-                        'network': ni.get('network', ''),
-                        'networkIP': ni.get('networkIP', ''),
-                        'accessConfigs': ni.get('accessConfigs', [])
-                    }
-                    network_interfaces.append(network_interface)
-                
-                # Extract disks
-                disks = []
-                for disk in item.get('disks', []):
-                    disk_info = {
-                        'boot': disk.get('boot', False),
-                        'autoDelete': disk.get('autoDelete', False),
-                        'source': disk.get('source', '')
-                    }
-                    disks.append(disk_info)
-                
-                instance = GCPInstance(
-                    name=item.get('name', ''),
-                    machine_type=item.get('machineType', '').split('/')[-1],
-                    zone=zone,
-                    status=item.get('status', ''),
-                    network_interfaces=network_interfaces,
-                    disks=disks,
-                    metadata=item.get('metadata', {}),
-                    labels=item.get('labels', {})
-                )
-                instances.append(instance)
+            instances = [self._instance_from_dict(item, zone) for item in result.get('items', [])]
             
-            return GCPInstanceList(
+            return _new_instance_list(
                 instances=instances,
                 next_page_token=result.get('nextPageToken')
             )
         except Exception as e:
-            logger.error(f"Error listing instances in zone {zone}: {e}")
+            logger.error(f"Error listing instances in zone {zone}: {describe_error(e)}")
             raise
     
+    def _fetch_instance_page(self, zone: str, page_token: Optional[str]) -> Dict[str, Any]:
+        """Fetch one raw page of the instance list for a zone."""
+        # The request is built on the calling thread so it uses that thread's connection
+        return self._instances.list(
+            project=self.project_id,
+            zone=zone,
+            pageToken=page_token,
+            fields=_LIST_FIELDS
+        ).execute()
+
     def get_instance(self, zone: str, name: str) -> Optional[GCPInstance]:
         """
         Get a specific instance by name in the specified zone.
@@ -109,50 +181,125 @@ class GCPService:
         Returns:
             GCPInstance: The instance if found, None otherwise
         """
+        hit, instance = self._lookup_listings(zone, name)
+        if hit:
+            return instance
+        return self._instance_cache.get_or_load((zone, name), lambda: self._fetch_instance(zone, name))
+    
+    def cached_instance(self, zone: str, name: str) -> Optional[GCPInstance]:
+        """
+        Get an instance from fresh cached reads only, without calling the API.
+        
+        Args:
+            zone: The zone where the instance is located
+            name: The name of the instance
+            
+        Returns:
+            GCPInstance: The cached instance, or None if it is not cached
+        """
+        hit, instance = self._lookup_listings(zone, name)
+        if hit:
+            return instance
+        return self._instance_cache.peek((zone, name))
+    
+    def _lookup_listings(self, zone: str, name: str) -> Tuple[bool, Optional[GCPInstance]]:
+        """
+        Look an instance up in the zone's fresh cached list pages.
+        
+        A name found on any cached page is a hit, and so is a miss once the
+        cached pages cover the whole zone (the instance does not exist).
+        
+        Returns:
+            Whether the pages answered the lookup, and the instance if found
+        """
+        page_token = None
+        while True:
+            listing = self._list_cache.peek((zone, page_token))
+            if listing is None:
+                return False, None
+            for instance in listing.instances:
+                if instance.name == name:
+                    return True, instance
+            page_token = listing.next_page_token
+            if page_token is None:
+                return True, None
+    
+    def _fetch_instance(self, zone: str, name: str) -> Optional[GCPInstance]:
+        """Fetch a single instance from the API, bypassing the cache."""
         try:
-            instance = self.compute_service.instances().get(
+            instance = self._instances.get(
                 project=self.project_id,
                 zone=zone,
-                instance=name
+                instance=name,
+                fields=_INSTANCE_FIELDS
             ).execute()
             
-            # Extract network interfaces
-            network_interfaces = []
-            for ni in instance.get('networkInterfaces', []):
-                network_interface = {
-                    'network': ni.get('network', ''),
-                    'networkIP': ni.get('networkIP', ''),
-                    'accessConfigs': ni.get('accessConfigs', [])
-                }
-                network_interfaces.append(network_interface)
-            
-            # Extract disks
-            disks = []
-            for disk in instance.get('disks', []):
-                disk_info = {
-                    'boot': disk.get('boot', False),
-                    'autoDelete': disk.get('autoDelete', False),
-                    'source': disk.get('source', '')
-                }
-                disks.append(disk_info)
-            
-            return GCPInstance(
-                name=instance.get('name', ''),
-                machine_type=instance.get('machineType', '').split('/')[-1],
-                zone=zone,
-                status=instance.get('status', ''),
-                network_interfaces=network_interfaces,
-                disks=disks,
-                metadata=instance.get('metadata', {}),
-                labels=instance.get('labels', {})
-            )
-        except Exception as e:
-            if "not found" in str(e).lower():
+            return self._instance_from_dict(instance, zone)
+        except HttpError as e:
+            if e.resp.status == 404:
                 logger.warning(f"Instance {name} not found in zone {zone}")
                 return None
-            logger.error(f"Error getting instance {name} in zone {zone}: {e}")
+            logger.error(f"Error getting instance {name} in zone {zone}: {describe_error(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting instance {name} in zone {zone}: {describe_error(e)}")
             raise
     
+    def list_zones(self) -> List[str]:
+        """
+        List the names of the zones available to the project.
+        
+        Returns:
+            List[str]: Names of the zones that are UP
+        """
+        return self._zones_cache.get_or_load(None, self._fetch_zones)
+    
+    def _fetch_zones(self) -> List[str]:
+        """Fetch the zone names from the API, bypassing the cache."""
+        try:
+            zones_api = self.compute_service.zones()
+            names = []
+            request = zones_api.list(project=self.project_id, fields='items(name,status),nextPageToken')
+            while request is not None:
+                response = request.execute()
+                names.extend(item['name'] for item in response.get('items', []) if item.get('status') == 'UP')
+                request = zones_api.list_next(request, response)
+            return names
+        except Exception as e:
+            logger.error(f"Error listing zones: {describe_error(e)}")
+            raise
+    
+    def list_all_zones(self, zones: List[str]) -> Dict[str, GCPInstanceList]:
+        """
+        List every instance in several zones concurrently.
+        
+        At most _MAX_FANOUT_CONCURRENCY zones are queried at once to stay within
+        API quotas and keep the number of open connections bounded. Each zone's
+        pages are followed to the end on its worker.
+        
+        Args:
+            zones: The zones to list instances from
+            
+        Returns:
+            Dict[str, GCPInstanceList]: All instances in each zone (no next page token)
+        """
+        try:
+            return dict(zip(zones, _zone_executor().map(self._list_all_pages, zones)))
+        except Exception as e:
+            logger.error(f"Error listing instances across zones {zones}: {describe_error(e)}")
+            raise
+    
+    def _list_all_pages(self, zone: str) -> GCPInstanceList:
+        """Combine every cached or fetched list page of a zone into one list."""
+        instances = []
+        page_token = None
+        while True:
+            instance_list = self.list_instances(zone, page_token)
+            instances.extend(instance_list.instances)
+            page_token = instance_list.next_page_token
+            if not page_token:
+                return _new_instance_list(instances=instances, next_page_token=None)
+    
     def create_instance(self, instance: GCPInstance) -> GCPOperationResult:
         """
         Create a new instance in GCP.
@@ -163,51 +310,98 @@ class GCPService:
         Returns:
             GCPOperationResult: The result of the create operation
         """
-        # Determine the full machine type URL
-        machine_type_url = f"zones/{instance.zone}/machineTypes/{instance.machine_type}"
-        
-        # Build the instance configuration
-        config = {
-            'name': instance.name,
-            'machineType': machine_type_url,
-            'networkInterfaces': instance.network_interfaces or [{
-                'network': f'global/networks/default',
-                'accessConfigs': [
-                    {'type': 'ONE_TO_ONE_NAT', 'name': 'External NAT'}
-                ]
-            }],
-            'disks': instance.disks or [{
-                'boot': True,
-                'autoDelete': True,
-                'initializeParams': {
-                    'sourceImage': instance.source_image
-                }
-            }],
-            'metadata': {
-                'items': [
-                    {'key': k, 'value': v} for k, v in instance.metadata.items()
-                ]
-            },
-            'labels': instance.labels
-        }
+        config = self._build_config(instance)
         
         try:
-            operation = self.compute_service.instances().insert(
+            self._invalidate(instance.zone, instance.name)
+            operation = self._instances.insert(
                 project=self.project_id,
                 zone=instance.zone,
                 body=config
             ).execute()
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='create',
-                target_id=operation.get('targetId')
+                target_id=operation.get('targetId'),
+                error=operation.get('error')
             )
         except Exception as e:
-            logger.error(f"Error creating instance {instance.name}: {e}")
+            logger.error(f"Error creating instance {instance.name}: {describe_error(e)}")
             raise
     
+    def create_instances(self, instances: List[GCPInstance]) -> List[GCPOperationResult]:
+        """
+        Create several instances using batched requests.
+        
+        Args:
+            instances: The GCPInstance objects with instance details
+            
+        Returns:
+            List[GCPOperationResult]: The result of each create operation, in order;
+                failed inserts have status 'ERROR' and the failure in error
+        """
+        try:
+            requests = []
+            for instance in instances:
+                self._invalidate(instance.zone, instance.name)
+                requests.append(self._instances.insert(
+                    project=self.project_id,
+                    zone=instance.zone,
+                    body=self._build_config(instance)
+                ))
+            
+            results = []
+            for instance, (operation, exception) in zip(instances, self._execute_batched(requests)):
+                if exception is not None:
+                    logger.error(f"Error creating instance {instance.name}: {describe_error(exception)}")
+                    results.append(_new_operation_result(
+                        name='',
+                        status='ERROR',
+                        operation_type='create',
+                        error={'message': str(exception)}
+                    ))
+                    continue
+                results.append(_new_operation_result(
+                    name=operation.get('name', ''),
+                    status=operation.get('status', ''),
+                    operation_type='create',
+                    target_id=operation.get('targetId')
+                ))
+            return results
+        except Exception as e:
+            logger.error(f"Error creating instances: {describe_error(e)}")
+            raise
+    
+    @staticmethod
+    def _build_config(instance: GCPInstance) -> Dict[str, Any]:
+        """
+        Build the insert request body for an instance.
+        
+        Args:
+            instance: The GCPInstance object with instance details
+            
+        Returns:
+            Dict[str, Any]: The instance configuration
+        """
+        return {
+            'name': instance.name,
+            'machineType': f"zones/{instance.zone}/machineTypes/{instance.machine_type}",
+            'networkInterfaces': instance.network_interfaces or _DEFAULT_NETWORK_INTERFACES,
+            'disks': instance.disks or [{
+                'boot': True,
+                'autoDelete': True,
+                'initializeParams': {
+                    'sourceImage': instance.source_image
+                }
+            }],
+            'metadata': {
+                'items': _metadata_items(instance.metadata)
+            },
+            'labels': instance.labels
+        }
+    
     def delete_instance(self, zone: str, name: str) -> GCPOperationResult:
         """
         Delete an instance from GCP.
@@ -220,20 +414,68 @@ class GCPService:
             GCPOperationResult: The result of the delete operation
         """
         try:
-            operation = self.compute_service.instances().delete(
+            self._invalidate(zone, name)
+            self._forget_fingerprints(zone, name)
+            operation = self._instances.delete(
                 project=self.project_id,
                 zone=zone,
                 instance=name
             ).execute()
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='delete',
-                target_id=operation.get('targetId')
+                target_id=operation.get('targetId'),
+                error=operation.get('error')
             )
         except Exception as e:
-            logger.error(f"Error deleting instance {name}: {e}")
+            logger.error(f"Error deleting instance {name}: {describe_error(e)}")
+            raise
+    
+    def delete_instances(self, zone: str, names: List[str]) -> List[GCPOperationResult]:
+        """
+        Delete several instances in a zone using batched requests.
+        
+        Args:
+            zone: The zone where the instances are located
+            names: The names of the instances to delete
+            
+        Returns:
+            List[GCPOperationResult]: The result of each delete operation, in order;
+                failed deletes have status 'ERROR' and the failure in error
+        """
+        try:
+            requests = []
+            for name in names:
+                self._invalidate(zone, name)
+                self._forget_fingerprints(zone, name)
+                requests.append(self._instances.delete(
+                    project=self.project_id,
+                    zone=zone,
+                    instance=name
+                ))
+            
+            results = []
+            for name, (operation, exception) in zip(names, self._execute_batched(requests)):
+                if exception is not None:
+                    logger.error(f"Error deleting instance {name}: {describe_error(exception)}")
+                    results.append(_new_operation_result(
+                        name='',
+                        status='ERROR',
+                        operation_type='delete',
+                        error={'message': str(exception)}
+                    ))
+                    continue
+                results.append(_new_operation_result(
+                    name=operation.get('name', ''),
+                    status=operation.get('status', ''),
+                    operation_type='delete',
+                    target_id=operation.get('targetId')
+                ))
+            return results
+        except Exception as e:
+            logger.error(f"Error deleting instances {names}: {describe_error(e)}")
             raise
     
     def modify_instance(self, zone: str, name: str, 
@@ -258,103 +500,159 @@ class GCPService:
             GCPOperationResult: The result of the modify operation
         """
         try:
-            # Get the current instance configuration
-            instance = self.compute_service.instances().get(
-                project=self.project_id,
-                zone=zone,
-                instance=name
-            ).execute()
+            needs_instance = machine_type is not None or network_interfaces is not None or disks is not None
+            if not needs_instance and labels is None and metadata is None:
+                raise ValueError("No modifications specified")
             
-            # Prepare the instance configuration for update
-            config = {}
+            self._invalidate(zone, name)
             
-            # Update machine type if provided
-            if machine_type is not None:
-                config['machineType'] = f"zones/{zone}/machineTypes/{machine_type}"
+            if needs_instance:
+                return self._update_instance(zone, name, machine_type, network_interfaces, disks, labels, metadata)
             
-            # Update network interfaces if provided
-            if network_interfaces is not None:
-                config['networkInterfaces'] = network_interfaces
+            # Label/metadata-only changes can use cached fingerprints instead of a GET
+            fingerprints = self._cached_fingerprints(zone, name)
+            fetched = fingerprints is None
+            if fetched:
+                self._fetch_instance_dict(zone, name, fields=_FINGERPRINT_FIELDS)
+                fingerprints = self._cached_fingerprints(zone, name)
             
-            # Update disks if provided
-            if disks is not None:
-                config['disks'] = disks
-            
-            # Update labels if provided
-            if labels is not None:
-                label_req = self.compute_service.instances().setLabels(
-                    project=self.project_id,
-                    zone=zone,
-                    instance=name,
-                    body={
-                        'labels': labels,
-                        'labelFingerprint': instance.get('labelFingerprint', '')
-                    }
-                ).execute()
-            
-            # Update metadata if provided
-            if metadata is not None:
-                metadata_items = [{'key': k, 'value': v} for k, v in metadata.items()]
-                metadata_req = self.compute_service.instances().setMetadata(
-                    project=self.project_id,
-                    zone=zone,
-                    instance=name,
-                    body={
-                        'items': metadata_items,
-                        'fingerprint': instance.get('metadata', {}).get('fingerprint', '')
-                    }
-                ).execute()
-            
-            # If there are configuration changes, update the instance
-            if config:
-                # Create a new instance configuration that preserves existing fields
-                update_config = {
-                    'name': name,
-                    'machineType': config.get('machineType', instance.get('machineType')),
-                    'networkInterfaces': config.get('networkInterfaces', instance.get('networkInterfaces')),
-                    'disks': config.get('disks', instance.get('disks')),
-                    'metadata': instance.get('metadata', {}),
-                    'labels': instance.get('labels', {})
-                }
-                
-                # Remove any None values to prevent API errors
-                update_config = {k: v for k, v in update_config.items() if v is not None}
-                
-                operation = self.compute_service.instances().update(
-                    project=self.project_id,
-                    zone=zone,
-                    instance=name,
-                    body=update_config
-                ).execute()
-                return GCPOperationResult(
-                    name=operation.get('name', ''),
-                    status=operation.get('status', ''),
-                    operation_type='modify',
-                    target_id=operation.get('targetId')
-                )
+            try:
+                label_req, metadata_req = self._set_labels_and_metadata(zone, name, labels, metadata, fingerprints)
+            except HttpError as e:
+                # A 412 means a cached fingerprint was stale; refetch once and retry
+                if e.resp.status != 412 or fetched:
+                    raise
+                self._fetch_instance_dict(zone, name, fields=_FINGERPRINT_FIELDS)
+                fingerprints = self._cached_fingerprints(zone, name)
+                label_req, metadata_req = self._set_labels_and_metadata(zone, name, labels, metadata, fingerprints)
             
-            # If only labels or metadata were updated, return that operation result
             if labels is not None:
-                return GCPOperationResult(
+                return _new_operation_result(
                     name=label_req.get('name', ''),
                     status=label_req.get('status', ''),
                     operation_type='modify_labels',
                     target_id=label_req.get('targetId')
                 )
-            elif metadata is not None:
-                return GCPOperationResult(
-                    name=metadata_req.get('name', ''),
-                    status=metadata_req.get('status', ''),
-                    operation_type='modify_metadata',
-                    target_id=metadata_req.get('targetId')
-                )
-            
-            raise ValueError("No modifications specified")
+            return _new_operation_result(
+                name=metadata_req.get('name', ''),
+                status=metadata_req.get('status', ''),
+                operation_type='modify_metadata',
+                target_id=metadata_req.get('targetId')
+            )
             
         except Exception as e:
-            logger.error(f"Error modifying instance {name}: {e}")
+            logger.error(f"Error modifying instance {name}: {describe_error(e)}")
             raise
 
+    def _update_instance(self, zone: str, name: str,
+                         machine_type: Optional[str],
+                         network_interfaces: Optional[List[Dict[str, Any]]],
+                         disks: Optional[List[Dict[str, Any]]],
+                         labels: Optional[Dict[str, str]],
+                         metadata: Optional[Dict[str, str]]) -> GCPOperationResult:
+        """
+        Apply configuration changes to an instance with a single update() call.
+        
+        New labels and metadata travel in the same request body, with the
+        fingerprints from the fetched instance, instead of as separate
+        setLabels/setMetadata calls that update() would otherwise overwrite.
+        """
+        instance = self._fetch_instance_dict(zone, name, fields=_UPDATE_FIELDS)
+        # Fingerprints change once the update applies
+        self._forget_fingerprints(zone, name)
+        
+        current_metadata = instance.get('metadata', {})
+        update_config = {
+            'name': name,
+            'machineType': f"zones/{zone}/machineTypes/{machine_type}" if machine_type is not None else instance.get('machineType'),
+            'networkInterfaces': network_interfaces if network_interfaces is not None else instance.get('networkInterfaces'),
+            'disks': disks if disks is not None else instance.get('disks'),
+            'metadata': current_metadata if metadata is None else {
+                'items': _metadata_items(metadata),
+                'fingerprint': current_metadata.get('fingerprint')
+            },
+            'labels': instance.get('labels', {}) if labels is None else labels,
+            'labelFingerprint': instance.get('labelFingerprint')
+        }
+        
+        # Remove any None values to prevent API errors
+        update_config = {k: v for k, v in update_config.items() if v is not None}
+        
+        operation = self._instances.update(
+            project=self.project_id,
+            zone=zone,
+            instance=name,
+            body=update_config
+        ).execute()
+        return _new_operation_result(
+            name=operation.get('name', ''),
+            status=operation.get('status', ''),
+            operation_type='modify',
+            target_id=operation.get('targetId')
+        )
+
+    def _set_labels_and_metadata(self, zone: str, name: str,
+                                 labels: Optional[Dict[str, str]],
+                                 metadata: Optional[Dict[str, str]],
+                                 fingerprints: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Apply new labels and/or metadata to an instance.
+        
+        Args:
+            zone: The zone where the instance is located
+            name: The name of the instance
+            labels: New labels to set, or None to leave them unchanged
+            metadata: New metadata to set, or None to leave it unchanged
+            fingerprints: Current 'labels' and 'metadata' fingerprints of the instance
+            
+        Returns:
+            Tuple of the setLabels and setMetadata operations (None for any not sent)
+        """
+        label_request = None
+        if labels is not None:
+            label_request = self._instances.setLabels(
+                project=self.project_id,
+                zone=zone,
+                instance=name,
+                body={
+                    'labels': labels,
+                    'labelFingerprint': fingerprints['labels']
+                }
+            )
+        
+        metadata_request = None
+        if metadata is not None:
+            metadata_items = _metadata_items(metadata)
+            metadata_request = self._instances.setMetadata(
+                project=self.project_id,
+                zone=zone,
+                instance=name,
+                body={
+                    'items': metadata_items,
+                    'fingerprint': fingerprints['metadata']
+                }
+            )
+        
+        if label_request is None and metadata_request is None:
+            return None, None
+        
+        # Both fingerprints change once these operations apply
+        self._forget_fingerprints(zone, name)
+        
+        # Send both updates in one round-trip when both are requested
+        if label_request is not None and metadata_request is not None:
+            (label_op, label_error), (metadata_op, metadata_error) = self._execute_batched(
+                [label_request, metadata_request]
+            )
+            if label_error is not None:
+                raise label_error
+            if metadata_error is not None:
+                raise metadata_error
+            return label_op, metadata_op
+        if label_request is not None:
+            return label_request.execute(), None
+        return None, metadata_request.execute()
+
     def modify_instance_with_restart(self, zone: str, name: str,
                                    machine_type: Optional[str] = None,
                                    network_interfaces: Optional[List[Dict[str, Any]]] = None,
@@ -379,17 +677,10 @@ class GCPService:
         try:
             results = []
             
-            # Stop the instance
-            stop_result = self.stop_instance(zone, name)
+            # Stop the instance; the stop operation is done once it is TERMINATED
+            stop_result = self.stop_instance(zone, name, wait=True)
             results.append(stop_result)
             
-            # Wait for the instance to stop
-            while True:
-                instance = self.get_instance(zone, name)
-                if instance and instance.status == "TERMINATED":
-                    break
-                time.sleep(5)  # Wait 5 seconds before checking again
-            
             # Modify the instance
             modify_result = self.modify_instance(
                 zone=zone,
@@ -402,6 +693,10 @@ class GCPService:
             )
             results.append(modify_result)
             
+            # Let the update finish before starting the instance again
+            if modify_result.name:
+                self.wait_for_operation(zone, modify_result.name)
+            
             # Start the instance
             start_result = self.start_instance(zone, name)
             results.append(start_result)
@@ -409,35 +704,40 @@ class GCPService:
             return results
             
         except Exception as e:
-            logger.error(f"Error in stop-edit-start workflow for instance {name}: {e}")
+            logger.error(f"Error in stop-edit-start workflow for instance {name}: {describe_error(e)}")
             raise
     
-    def stop_instance(self, zone: str, name: str) -> GCPOperationResult:
+    def stop_instance(self, zone: str, name: str, wait: bool = False) -> GCPOperationResult:
         """
         Stop a running instance.
         
         Args:
             zone: The zone where the instance is located
             name: The name of the instance to stop
+            wait: Block until the operation finishes and report its final status
             
         Returns:
             GCPOperationResult: The result of the stop operation
         """
         try:
-            operation = self.compute_service.instances().stop(
+            self._invalidate(zone, name)
+            operation = self._instances.stop(
                 project=self.project_id,
                 zone=zone,
                 instance=name
             ).execute()
+            if wait:
+                operation = self._await_operation(zone, name, operation)
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='stop',
-                target_id=operation.get('targetId')
+                target_id=operation.get('targetId'),
+                error=operation.get('error')
             )
         except Exception as e:
-            logger.error(f"Error stopping instance {name}: {e}")
+            logger.error(f"Error stopping instance {name}: {describe_error(e)}")
             raise
     
     def start_instance(self, zone: str, name: str) -> GCPOperationResult:
@@ -452,20 +752,22 @@ class GCPService:
             GCPOperationResult: The result of the start operation
         """
         try:
-            operation = self.compute_service.instances().start(
+            self._invalidate(zone, name)
+            operation = self._instances.start(
                 project=self.project_id,
                 zone=zone,
                 instance=name
             ).execute()
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='start',
-                target_id=operation.get('targetId')
+                target_id=operation.get('targetId'),
+                error=operation.get('error')
             )
         except Exception as e:
-            logger.error(f"Error starting instance {name}: {e}")
+            logger.error(f"Error starting instance {name}: {describe_error(e)}")
             raise
 
     def add_disk(self, zone: str, name: str, disk_config: Dict[str, Any]) -> GCPOperationResult:
@@ -486,8 +788,10 @@ class GCPService:
             GCPOperationResult: The result of the add disk operation
         """
         try:
+            self._invalidate(zone, name)
+            
             # Get the current instance configuration
-            instance = self.compute_service.instances().get(
+            instance = self._instances.get(
                 project=self.project_id,
                 zone=zone,
                 instance=name
@@ -509,38 +813,32 @@ class GCPService:
             }
             
             # Create the disk first
-            disk_operation = self.compute_service.disks().insert(
+            disk_operation = self._disks.insert(
                 project=self.project_id,
                 zone=zone,
                 body=disk_body
             ).execute()
             
-            # Wait for disk creation to complete
-            while True:
-                disk = self.compute_service.disks().get(
-                    project=self.project_id,
-                    zone=zone,
-                    disk=disk_name
-                ).execute()
-                if disk.get('status') == 'READY':
-                    break
-                time.sleep(5)
+            # Wait for disk creation to complete; the disk is READY once its insert is done
+            disk_operation = self.wait_for_operation(zone, disk_operation.get('name', ''))
+            if disk_operation.get('error'):
+                raise ValueError(f"Failed to create disk {disk_name}: {disk_operation['error']}")
             
             # Attach the disk to the instance
             attach_body = {
-                'source': f"projects/{self.project_id}/zones/{zone}/disks/{disk_name}",
+                'source': f"{self._project_prefix}/zones/{zone}/disks/{disk_name}",
                 'autoDelete': auto_delete,
                 'mode': mode
             }
             
-            operation = self.compute_service.instances().attachDisk(
+            operation = self._instances.attachDisk(
                 project=self.project_id,
                 zone=zone,
                 instance=name,
                 body=attach_body
             ).execute()
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='add_disk',
@@ -548,7 +846,7 @@ class GCPService:
             )
             
         except Exception as e:
-            logger.error(f"Error adding disk to instance {name}: {e}")
+            logger.error(f"Error adding disk to instance {name}: {describe_error(e)}")
             raise
 
     def modify_disk(self, zone: str, name: str, disk_name: str, 
@@ -568,13 +866,6 @@ class GCPService:
             GCPOperationResult: The result of the modify disk operation
         """
         try:
-            # Get the current disk configuration
-            disk = self.compute_service.disks().get(
-                project=self.project_id,
-                zone=zone,
-                disk=disk_name
-            ).execute()
-            
             # Prepare the update configuration
             update_config = {}
             
@@ -587,15 +878,17 @@ class GCPService:
             if not update_config:
                 raise ValueError("No modifications specified for disk")
             
+            self._invalidate(zone, name)
+            
             # Update the disk
-            operation = self.compute_service.disks().update(
+            operation = self._disks.update(
                 project=self.project_id,
                 zone=zone,
                 disk=disk_name,
                 body=update_config
             ).execute()
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='modify_disk',
@@ -603,7 +896,7 @@ class GCPService:
             )
             
         except Exception as e:
-            logger.error(f"Error modifying disk {disk_name} on instance {name}: {e}")
+            logger.error(f"Error modifying disk {disk_name} on instance {name}: {describe_error(e)}")
             raise
 
     def attach_disk(self, zone: str, name: str, disk_name: str,
@@ -623,31 +916,28 @@ class GCPService:
             GCPOperationResult: The result of the attach disk operation
         """
         try:
-            # Check if disk exists
-            disk = self.compute_service.disks().get(
-                project=self.project_id,
-                zone=zone,
-                disk=disk_name
-            ).execute()
+            self._invalidate(zone, name)
             
-            if not disk:
-                raise ValueError(f"Disk {disk_name} not found in zone {zone}")
-            
-            # Attach the disk
+            # Attach the disk; a missing disk is reported by attachDisk itself
             attach_body = {
-                'source': f"projects/{self.project_id}/zones/{zone}/disks/{disk_name}",
+                'source': f"{self._project_prefix}/zones/{zone}/disks/{disk_name}",
                 'autoDelete': auto_delete,
                 'mode': mode
             }
             
-            operation = self.compute_service.instances().attachDisk(
-                project=self.project_id,
-                zone=zone,
-                instance=name,
-                body=attach_body
-            ).execute()
+            try:
+                operation = self._instances.attachDisk(
+                    project=self.project_id,
+                    zone=zone,
+                    instance=name,
+                    body=attach_body
+                ).execute()
+            except HttpError as e:
+                if e.resp.status == 404:
+                    raise ValueError(f"Disk {disk_name} or instance {name} not found in zone {zone}") from e
+                raise
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='attach_disk',
@@ -655,7 +945,7 @@ class GCPService:
             )
             
         except Exception as e:
-            logger.error(f"Error attaching disk {disk_name} to instance {name}: {e}")
+            logger.error(f"Error attaching disk {disk_name} to instance {name}: {describe_error(e)}")
             raise
 
     def detach_disk(self, zone: str, name: str, device_name: str) -> GCPOperationResult:
@@ -671,14 +961,15 @@ class GCPService:
             GCPOperationResult: The result of the detach disk operation
         """
         try:
-            operation = self.compute_service.instances().detachDisk(
+            self._invalidate(zone, name)
+            operation = self._instances.detachDisk(
                 project=self.project_id,
                 zone=zone,
                 instance=name,
                 deviceName=device_name
             ).execute()
             
-            return GCPOperationResult(
+            return _new_operation_result(
                 name=operation.get('name', ''),
                 status=operation.get('status', ''),
                 operation_type='detach_disk',
@@ -686,5 +977,148 @@ class GCPService:
             )
             
         except Exception as e:
-            logger.error(f"Error detaching disk {device_name} from instance {name}: {e}")
-            raise
\ No newline at end of file
+            logger.error(f"Error detaching disk {device_name} from instance {name}: {describe_error(e)}")
+            raise
+
+    def wait_for_operation(self, zone: str, operation_name: str, timeout: float = 600) -> Dict[str, Any]:
+        """
+        Wait for a zonal operation to finish.
+        
+        Uses zoneOperations.wait, which blocks server-side until the operation
+        is done or about two minutes pass, so there is no client-side polling
+        interval; transient errors are retried with backoff by the transport.
+        
+        Args:
+            zone: The zone of the operation
+            operation_name: The name of the operation
+            timeout: Seconds to wait before giving up
+            
+        Returns:
+            Dict[str, Any]: The finished operation resource
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            operation = self._zone_operations.wait(
+                project=self.project_id,
+                zone=zone,
+                operation=operation_name
+            ).execute()
+            if operation.get('status') == 'DONE':
+                return operation
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Operation {operation_name} in zone {zone} did not finish within {timeout} seconds")
+    
+    def _await_operation(self, zone: str, name: str, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for an instance operation, then drop reads cached while it ran."""
+        operation = self.wait_for_operation(zone, operation.get('name', ''))
+        self._invalidate(zone, name)
+        return operation
+    
+    def _invalidate(self, zone: str, name: str):
+        """Drop cached reads of an instance and of its zone's listings before a change."""
+        self._instance_cache.invalidate_where(lambda key: key == (zone, name))
+        self._list_cache.invalidate_where(lambda key: key[0] == zone)
+
+    def _execute_batched(self, requests: List[HttpRequest]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Execute requests in batch HTTP requests of up to _BATCH_LIMIT calls each.
+        
+        Args:
+            requests: The unexecuted API requests
+            
+        Returns:
+            List of (response, exception) pairs in the same order as requests
+        """
+        results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(requests)
+        
+        def callback(request_id, response, exception):
+            results[int(request_id)] = (response, exception)
+        
+        for start in range(0, len(requests), _BATCH_LIMIT):
+            batch = self.compute_service.new_batch_http_request(callback=callback)
+            for index in range(start, min(start + _BATCH_LIMIT, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            batch.execute()
+        
+        return results
+
+    def _fetch_instance_dict(self, zone: str, name: str, fields: Optional[str] = None) -> Dict[str, Any]:
+        """Get the raw instance resource (optionally only the given fields) and record its fingerprints."""
+        instance = self._instances.get(
+            project=self.project_id,
+            zone=zone,
+            instance=name,
+            fields=fields
+        ).execute()
+        self._remember_fingerprints(zone, instance)
+        return instance
+
+    def _cached_fingerprints(self, zone: str, name: str) -> Optional[Dict[str, str]]:
+        """Return the last seen label and metadata fingerprints of an instance, if any."""
+        with self._fingerprints_lock:
+            fingerprints = self._fingerprints.get((zone, name))
+            if fingerprints is not None:
+                self._fingerprints.move_to_end((zone, name))
+            return fingerprints
+
+    def _remember_fingerprints(self, zone: str, item: Dict[str, Any]):
+        """Record the label and metadata fingerprints from an instance resource."""
+        fingerprints = {
+            'labels': item.get('labelFingerprint', ''),
+            'metadata': item.get('metadata', {}).get('fingerprint', '')
+        }
+        key = (zone, item.get('name', ''))
+        with self._fingerprints_lock:
+            self._fingerprints[key] = fingerprints
+            self._fingerprints.move_to_end(key)
+            if len(self._fingerprints) > _FINGERPRINT_CACHE_SIZE:
+                self._fingerprints.popitem(last=False)
+
+    def _forget_fingerprints(self, zone: str, name: str):
+        """Drop the cached fingerprints of an instance."""
+        with self._fingerprints_lock:
+            self._fingerprints.pop((zone, name), None)
+
+    def _instance_from_dict(self, item: Dict[str, Any], zone: str) -> GCPInstance:
+        """
+        Convert an instance dictionary from the API to a GCPInstance model.
+        
+        Also records the instance's fingerprints for later label/metadata updates.
+        
+        Args:
+            item: The instance dictionary
+            zone: The zone the instance is in
+            
+        Returns:
+            GCPInstance: The instance model
+        """
+        self._remember_fingerprints(zone, item)
+        
+        # Keep only the network interface and disk fields the models expose
+        network_interfaces = [
+            {
+                'network': ni.get('network', ''),
+                'networkIP': ni.get('networkIP', ''),
+                'accessConfigs': ni.get('accessConfigs', [])
+            }
+            for ni in item.get('networkInterfaces', ())
+        ]
+        disks = [
+            {
+                'boot': disk.get('boot', False),
+                'autoDelete': disk.get('autoDelete', False),
+                'source': disk.get('source', '')
+            }
+            for disk in item.get('disks', ())
+        ]
+        
+        return _new_instance(
+            name=item.get('name', ''),
+            machine_type=sys.intern(item.get('machineType', '').rpartition('/')[2]),
+            zone=zone,
+            status=item.get('status', ''),
+            network_interfaces=network_interfaces,
+            disks=disks,
+            metadata=item.get('metadata', {}),
+            labels=item.get('labels', {})
+        )
@@ -0,0 +1,209 @@
+"""
+Shared HTTP transport helpers for the Google API discovery clients.
+"""
+import functools
+import json
+import socket
+import threading
+import time
+from typing import Optional
+
+import google_auth_httplib2
+import httplib2
+from googleapiclient import discovery, discovery_cache
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from src.server.config import GCP_API_QPS, GCP_API_NUM_RETRIES, GCP_API_TIMEOUT
+
+
+class TunedHttp(httplib2.Http):
+    """
+    httplib2.Http that disables Nagle's algorithm and enables TCP keep-alive.
+
+    API request bodies are small, so sending them immediately instead of
+    waiting to coalesce segments cuts latency, and keep-alive probes stop
+    idle connections between tool calls from being silently dropped.
+    """
+
+    def _conn_request(self, conn, request_uri, method, body, headers):
+        _tune_socket(conn)
+        try:
+            return super()._conn_request(conn, request_uri, method, body, headers)
+        finally:
+            # A connection opened by this request is tuned for the ones after it
+            _tune_socket(conn)
+
+
+def _tune_socket(conn):
+    """Apply socket options once to the connection's current socket."""
+    sock = conn.sock
+    if sock is None or getattr(conn, '_tuned_sock', None) is sock:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError:
+        return
+    conn._tuned_sock = sock
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often requests may start.
+
+    Callers that find the bucket empty reserve a future token and sleep until
+    it is due, so waiting callers are released at the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum burst size (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+
+# Shared by every client so the combined request rate stays under the project quota
+_rate_limiter = TokenBucket(GCP_API_QPS)
+
+
+class ThrottledHttpRequest(HttpRequest):
+    """
+    HttpRequest that waits for the shared rate limiter and retries reads by default.
+
+    googleapiclient already retries 429 and 5xx responses with randomized
+    exponential backoff when num_retries is set; this makes that the default
+    for requests that are safe to repeat. Mutations are not retried unless the
+    caller passes num_retries: a retry after a timeout could repeat a change
+    the server already applied, or turn its success into a conflict error.
+    """
+
+    def execute(self, http=None, num_retries=None):
+        _rate_limiter.acquire()
+        if num_retries is None:
+            num_retries = GCP_API_NUM_RETRIES if self._is_idempotent() else 0
+        return super().execute(http=http, num_retries=num_retries)
+
+    def _is_idempotent(self) -> bool:
+        """Whether repeating the request cannot change anything: reads and operation waits."""
+        return self.method == 'GET' or self.uri.partition('?')[0].endswith('/wait')
+
+
+def describe_error(error: BaseException) -> str:
+    """
+    Summarize an exception for logging.
+
+    str() of an HttpError embeds the request URI and the full error details
+    from the response body; the status code and reason are enough for logs.
+    """
+    if isinstance(error, HttpError):
+        return f"HTTP {error.resp.status} {error.reason}"
+    return str(error)
+
+
+class OrjsonModel(JsonModel):
+    """
+    JsonModel that encodes request bodies and parses responses with orjson.
+
+    Aggregated listings can be large, and orjson decodes them several times
+    faster than the standard library json module.
+    """
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        try:
+            return orjson.dumps(body_value).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # Values orjson does not support go through the stock encoder
+            return super().serialize(body_value)
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def build_service(api: str, version: str, credentials):
+    """
+    Build a discovery client that is safe to call from worker threads.
+
+    httplib2.Http is not thread-safe, so instead of sharing one Http object
+    every thread gets its own authorized Http. Each of those keeps its
+    connections open, so calls after the first on a thread skip the TCP and
+    TLS handshakes. Every request is bounded by GCP_API_TIMEOUT so a stalled
+    connection fails instead of pinning a worker thread forever.
+
+    Args:
+        api: The API name (e.g. "compute", "container")
+        version: The API version (e.g. "v1")
+        credentials: google-auth credentials used to authorize requests
+
+    Returns:
+        The discovery Resource for the API
+    """
+    local = threading.local()
+
+    def thread_http():
+        http = getattr(local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=TunedHttp(cache=None, timeout=GCP_API_TIMEOUT))
+            local.http = http
+        return http
+
+    def build_request(http, *args, **kwargs):
+        return ThrottledHttpRequest(thread_http(), *args, **kwargs)
+
+    model = OrjsonModel() if orjson is not None else JsonModel()
+    document = _discovery_document(api, version)
+    if document is None:
+        return discovery.build(api, version, http=thread_http(), model=model, requestBuilder=build_request)
+    return discovery.build_from_document(document, http=thread_http(), model=model, requestBuilder=build_request)
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_document(api: str, version: str) -> Optional[dict]:
+    """
+    Parse the discovery document bundled with googleapiclient once per API.
+
+    Every client for the same API (one per credentials file) reuses the
+    parsed document instead of reading and decoding the ~1 MB JSON again.
+
+    Returns:
+        The parsed document, or None if no static copy ships for this API
+    """
+    content = discovery_cache.get_static_doc(api, version)
+    if content is None:
+        return None
+    return orjson.loads(content) if orjson is not None else json.loads(content)
@@ -2,11 +2,49 @@ import logging
 import asyncio
 from typing import Dict, List, Optional, Any, Literal, Union
 
+from googleapiclient.errors import HttpError
 from src.core.gke_service import GKEService
+from src.core.transport import describe_error
 from src.models.gke_models import GKECluster, NodePool, NodeTaint
 
 logger = logging.getLogger(__name__)
 
+
+def _render_node_pool(pool: NodePool, indent: str = "") -> List[str]:
+    """
+    Render a node pool as text chunks for a tool response.
+    
+    Args:
+        pool: The node pool to render
+        indent: Prefix for every line (the pool's bullet is at this depth)
+    """
+    parts = [
+        f"{indent}- {pool.name}\n"
+        f"{indent}  Nodes: {pool.node_count}\n"
+        f"{indent}  Machine Type: {pool.machine_type}\n"
+        f"{indent}  Disk: {pool.disk_size_gb}GB ({pool.disk_type})\n"
+        f"{indent}  Max Pods Per Node: {pool.max_pods_per_node}\n"
+    ]
+    
+    if pool.autoscaling_enabled:
+        parts.append(f"{indent}  Autoscaling: {pool.min_node_count} to {pool.max_node_count} nodes\n")
+    
+    labels = pool.kubernetes_labels
+    if labels:
+        parts.append(f"{indent}  Kubernetes Labels:\n")
+        parts.extend(f"{indent}    {k}: {v}\n" for k, v in labels.items())
+    
+    if pool.network_tags:
+        parts.append(f"{indent}  Network Tags: {', '.join(pool.network_tags)}\n")
+    
+    taints = pool.taints
+    if taints:
+        parts.append(f"{indent}  Taints:\n")
+        parts.extend(f"{indent}    {taint.key}={taint.value}:{taint.effect}\n" for taint in taints)
+    
+    return parts
+
+
 class GKETools:
     """
     Collection of GKE cluster and nodepool management tools for MCP.
@@ -37,24 +75,26 @@ class GKETools:
                 location: The zone or region to list clusters from (optional, e.g. us-central1 or us-central1-a)
             """
             try:
-                clusters = self.gke_service.list_clusters(location)
+                clusters = await asyncio.to_thread(self.gke_service.list_clusters, location)
                 
                 if not clusters:
                     return f"No GKE clusters found{' in ' + location if location else ''}."
                 
                 # Format the response
-                result = f"GKE Clusters{' in ' + location if location else ''}:\n\n"
+                parts = [f"GKE Clusters{' in ' + location if location else ''}:\n\n"]
                 for cluster in clusters:
                     cluster_type = "Autopilot" if cluster.autopilot else "Standard"
-                    result += f"- {cluster.name} ({cluster_type})\n"
-                    result += f"  Location: {cluster.location} ({cluster.location_type})\n"
-                    result += f"  Kubernetes Version: {cluster.kubernetes_version or 'unknown'}\n"
-                    result += f"  Node Pools: {len(cluster.node_pools)}\n"
-                    result += "\n"
-                
-                return result
+                    parts.append(
+                        f"- {cluster.name} ({cluster_type})\n"
+                        f"  Location: {cluster.location} ({cluster.location_type})\n"
+                        f"  Kubernetes Version: {cluster.kubernetes_version or 'unknown'}\n"
+                        f"  Node Pools: {len(cluster.node_pools)}\n"
+                        "\n"
+                    )
+                
+                return "".join(parts)
             except Exception as e:
-                logger.error(f"Error listing GKE clusters: {e}")
+                logger.error("Error listing GKE clusters: %s", describe_error(e))
                 return f"Failed to list GKE clusters: {str(e)}"
         
         # Get cluster details tool
@@ -68,59 +108,42 @@ class GKETools:
                 location: The zone or region where the cluster is located (e.g. us-central1 or us-central1-a)
             """
             try:
-                cluster = self.gke_service.get_cluster(name, location)
+                cluster = await asyncio.to_thread(self.gke_service.get_cluster, name, location)
                 
                 if not cluster:
                     return f"GKE cluster '{name}' not found in location {location}."
                 
                 # Format the response
-                result = f"GKE Cluster: {cluster.name}\n"
-                result += f"  Location: {cluster.location} ({cluster.location_type})\n"
-                result += f"  Type: {'Autopilot' if cluster.autopilot else 'Standard'}\n"
-                result += f"  Kubernetes Version: {cluster.kubernetes_version or 'unknown'}\n"
-                
-                # Add network information
-                result += "  Network Configuration:\n"
-                result += f"    VPC Network: {cluster.network or 'default'}\n"
-                result += f"    Subnetwork: {cluster.subnetwork or 'default'}\n"
-                result += f"    Pod Address Range: {cluster.cluster_ipv4_cidr or 'auto'}\n"
-                result += f"    Service Address Range: {cluster.services_ipv4_cidr or 'auto'}\n"
-                result += f"    Private Cluster: {'Yes' if cluster.private_cluster else 'No'}\n"
+                parts = [
+                    f"GKE Cluster: {cluster.name}\n"
+                    f"  Location: {cluster.location} ({cluster.location_type})\n"
+                    f"  Type: {'Autopilot' if cluster.autopilot else 'Standard'}\n"
+                    f"  Kubernetes Version: {cluster.kubernetes_version or 'unknown'}\n"
+                    # Network information
+                    "  Network Configuration:\n"
+                    f"    VPC Network: {cluster.network or 'default'}\n"
+                    f"    Subnetwork: {cluster.subnetwork or 'default'}\n"
+                    f"    Pod Address Range: {cluster.cluster_ipv4_cidr or 'auto'}\n"
+                    f"    Service Address Range: {cluster.services_ipv4_cidr or 'auto'}\n"
+                    f"    Private Cluster: {'Yes' if cluster.private_cluster else 'No'}\n"
+                ]
                 
                 if cluster.private_cluster:
-                    result += f"    Master CIDR Block: {cluster.master_ipv4_cidr_block}\n"
-                    result += f"    Private Nodes: {'Yes' if cluster.enable_private_nodes else 'No'}\n"
-                    result += f"    Private Endpoint: {'Yes' if cluster.enable_private_endpoint else 'No'}\n"
+                    parts.append(
+                        f"    Master CIDR Block: {cluster.master_ipv4_cidr_block}\n"
+                        f"    Private Nodes: {'Yes' if cluster.enable_private_nodes else 'No'}\n"
+                        f"    Private Endpoint: {'Yes' if cluster.enable_private_endpoint else 'No'}\n"
+                    )
                 
                 # Add node pool information
                 if not cluster.autopilot:
-                    result += "\n  Node Pools:\n"
+                    parts.append("\n  Node Pools:\n")
                     for pool in cluster.node_pools:
-                        result += f"    - {pool.name}\n"
-                        result += f"      Nodes: {pool.node_count}\n"
-                        result += f"      Machine Type: {pool.machine_type}\n"
-                        result += f"      Disk: {pool.disk_size_gb}GB ({pool.disk_type})\n"
-                        result += f"      Max Pods Per Node: {pool.max_pods_per_node}\n"
-                        
-                        if pool.autoscaling_enabled:
-                            result += f"      Autoscaling: {pool.min_node_count} to {pool.max_node_count} nodes\n"
-                        
-                        if pool.kubernetes_labels:
-                            result += "      Kubernetes Labels:\n"
-                            for k, v in pool.kubernetes_labels.items():
-                                result += f"        {k}: {v}\n"
-                        
-                        if pool.network_tags:
-                            result += f"      Network Tags: {', '.join(pool.network_tags)}\n"
-                        
-                        if pool.taints:
-                            result += "      Taints:\n"
-                            for taint in pool.taints:
-                                result += f"        {taint.key}={taint.value}:{taint.effect}\n"
-                
-                return result
+                        parts.extend(_render_node_pool(pool, indent="    "))
+                
+                return "".join(parts)
             except Exception as e:
-                logger.error(f"Error getting GKE cluster details: {e}")
+                logger.error("Error getting GKE cluster details: %s", describe_error(e))
                 return f"Failed to get details for GKE cluster '{name}' in location {location}: {str(e)}"
         
         # Create cluster tool
@@ -158,14 +181,14 @@ class GKETools:
                 master_cidr_block: For private clusters, CIDR range for the master (e.g. "172.16.0.0/28")
                 kubernetes_version: Kubernetes version to use (e.g. "1.27.3-gke.100")
             """
+            # Set defaults for private cluster options if not specified
+            if private_cluster:
+                enable_private_nodes = True if enable_private_nodes is None else enable_private_nodes
+                enable_private_endpoint = False if enable_private_endpoint is None else enable_private_endpoint
+                if not master_cidr_block:
+                    return "When creating a private cluster, master_cidr_block must be specified."
+            
             try:
-                # Set defaults for private cluster options if not specified
-                if private_cluster:
-                    enable_private_nodes = True if enable_private_nodes is None else enable_private_nodes
-                    enable_private_endpoint = False if enable_private_endpoint is None else enable_private_endpoint
-                    if not master_cidr_block:
-                        return "When creating a private cluster, master_cidr_block must be specified."
-                
                 # Create cluster object
                 cluster = GKECluster(
                     name=name,
@@ -184,11 +207,11 @@ class GKETools:
                 )
                 
                 # Create the cluster
-                result = self.gke_service.create_cluster(cluster)
+                result = await asyncio.to_thread(self.gke_service.create_cluster, cluster)
                 
                 return f"Creating GKE cluster '{name}' in {location} ({location_type}). Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error creating GKE cluster: {e}")
+                logger.error("Error creating GKE cluster: %s", describe_error(e))
                 return f"Failed to create GKE cluster '{name}' in {location}: {str(e)}"
         
         # Create a standard cluster with node pools
@@ -232,6 +255,9 @@ class GKETools:
                 master_cidr_block: For private clusters, CIDR range for the master (e.g. "172.16.0.0/28")
                 kubernetes_version: Kubernetes version to use (e.g. "1.27.3-gke.100")
             """
+            if private_cluster and not master_cidr_block:
+                return "When creating a private cluster, master_cidr_block must be specified."
+            
             try:
                 # Create node pool
                 node_pool = NodePool(
@@ -247,9 +273,6 @@ class GKETools:
                 enable_private_nodes = True if private_cluster else None
                 enable_private_endpoint = False if private_cluster else None
                 
-                if private_cluster and not master_cidr_block:
-                    return "When creating a private cluster, master_cidr_block must be specified."
-                
                 # Create cluster object
                 cluster = GKECluster(
                     name=name,
@@ -269,11 +292,11 @@ class GKETools:
                 )
                 
                 # Create the cluster
-                result = self.gke_service.create_cluster(cluster)
+                result = await asyncio.to_thread(self.gke_service.create_cluster, cluster)
                 
                 return f"Creating standard GKE cluster '{name}' in {location} with node pool '{node_pool_name}'. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error creating standard GKE cluster: {e}")
+                logger.error("Error creating standard GKE cluster: %s", describe_error(e))
                 return f"Failed to create standard GKE cluster '{name}' in {location}: {str(e)}"
         
         # Delete cluster tool
@@ -287,17 +310,18 @@ class GKETools:
                 location: The zone or region where the cluster is located
             """
             try:
-                # Check if cluster exists
-                existing = self.gke_service.get_cluster(name, location)
-                if not existing:
-                    return f"GKE cluster '{name}' not found in location {location}."
-                
-                # Delete the cluster
-                result = self.gke_service.delete_cluster(name, location)
+                # Delete the cluster; the API reports a missing cluster itself,
+                # so no existence check is needed first
+                try:
+                    result = await asyncio.to_thread(self.gke_service.delete_cluster, name, location)
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        return f"GKE cluster '{name}' not found in location {location}."
+                    raise
                 
                 return f"Deleting GKE cluster '{name}' in {location}. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error deleting GKE cluster: {e}")
+                logger.error("Error deleting GKE cluster: %s", describe_error(e))
                 return f"Failed to delete GKE cluster '{name}' in {location}: {str(e)}"
         
         # List node pools tool
@@ -312,48 +336,25 @@ class GKETools:
             """
             try:
                 # Check if cluster exists
-                cluster = self.gke_service.get_cluster(cluster_name, location)
+                cluster, node_pools = await asyncio.to_thread(self.gke_service.get_cluster_with_node_pools, cluster_name, location)
                 if not cluster:
                     return f"GKE cluster '{cluster_name}' not found in location {location}."
                 
                 if cluster.autopilot:
                     return f"Cluster '{cluster_name}' is an Autopilot cluster, which does not have user-manageable node pools."
                 
-                node_pools = self.gke_service.list_node_pools(cluster_name, location)
-                
                 if not node_pools:
                     return f"No node pools found in GKE cluster '{cluster_name}'."
                 
                 # Format the response
-                result = f"Node Pools in GKE Cluster '{cluster_name}':\n\n"
+                parts = [f"Node Pools in GKE Cluster '{cluster_name}':\n\n"]
                 for pool in node_pools:
-                    result += f"- {pool.name}\n"
-                    result += f"  Nodes: {pool.node_count}\n"
-                    result += f"  Machine Type: {pool.machine_type}\n"
-                    result += f"  Disk: {pool.disk_size_gb}GB ({pool.disk_type})\n"
-                    result += f"  Max Pods Per Node: {pool.max_pods_per_node}\n"
-                    
-                    if pool.autoscaling_enabled:
-                        result += f"  Autoscaling: {pool.min_node_count} to {pool.max_node_count} nodes\n"
-                    
-                    if pool.kubernetes_labels:
-                        result += "  Kubernetes Labels:\n"
-                        for k, v in pool.kubernetes_labels.items():
-                            result += f"    {k}: {v}\n"
-                    
-                    if pool.network_tags:
-                        result += f"  Network Tags: {', '.join(pool.network_tags)}\n"
-                    
-                    if pool.taints:
-                        result += "  Taints:\n"
-                        for taint in pool.taints:
-                            result += f"    {taint.key}={taint.value}:{taint.effect}\n"
-                    
-                    result += "\n"
-                
-                return result
+                    parts.extend(_render_node_pool(pool))
+                    parts.append("\n")
+                
+                return "".join(parts)
             except Exception as e:
-                logger.error(f"Error listing node pools: {e}")
+                logger.error("Error listing node pools: %s", describe_error(e))
                 return f"Failed to list node pools in GKE cluster '{cluster_name}' in {location}: {str(e)}"
         
         # Create node pool tool
@@ -395,35 +396,31 @@ class GKETools:
                 labels: Key-value pairs of GCP labels to apply to the node pool
                 taints: List of Kubernetes taints to apply to nodes (format: [{"key": "key1", "value": "value1", "effect": "NO_SCHEDULE"}])
             """
+            # Validate arguments first so bad input never costs a cluster lookup
+            if autoscaling_enabled:
+                if min_node_count is None or max_node_count is None:
+                    return "When autoscaling is enabled, both min_node_count and max_node_count must be specified."
+                if min_node_count >= max_node_count:
+                    return "min_node_count must be less than max_node_count."
+            
             try:
+                # Process taints if provided
+                try:
+                    node_taints = [
+                        NodeTaint(key=taint["key"], value=taint["value"], effect=taint.get("effect", "NO_SCHEDULE"))
+                        for taint in taints or ()
+                    ]
+                except KeyError:
+                    return "Each taint must have at least a 'key' and 'value'."
+                
                 # Check if cluster exists
-                cluster = self.gke_service.get_cluster(cluster_name, location)
+                cluster = await asyncio.to_thread(self.gke_service.get_cluster, cluster_name, location)
                 if not cluster:
                     return f"GKE cluster '{cluster_name}' not found in location {location}."
                 
                 if cluster.autopilot:
                     return f"Cluster '{cluster_name}' is an Autopilot cluster, which does not support adding custom node pools."
                 
-                # Validate autoscaling settings
-                if autoscaling_enabled:
-                    if min_node_count is None or max_node_count is None:
-                        return "When autoscaling is enabled, both min_node_count and max_node_count must be specified."
-                    if min_node_count >= max_node_count:
-                        return "min_node_count must be less than max_node_count."
-                
-                # Process taints if provided
-                node_taints = []
-                if taints:
-                    for taint in taints:
-                        if "key" not in taint or "value" not in taint:
-                            return "Each taint must have at least a 'key' and 'value'."
-                        effect = taint.get("effect", "NO_SCHEDULE")
-                        node_taints.append(NodeTaint(
-                            key=taint["key"],
-                            value=taint["value"],
-                            effect=effect
-                        ))
-                
                 # Create node pool object
                 node_pool = NodePool(
                     name=node_pool_name,
@@ -442,11 +439,11 @@ class GKETools:
                 )
                 
                 # Create the node pool
-                result = self.gke_service.create_node_pool(cluster_name, location, node_pool)
+                result = await asyncio.to_thread(self.gke_service.create_node_pool, cluster_name, location, node_pool)
                 
                 return f"Creating node pool '{node_pool_name}' in GKE cluster '{cluster_name}'. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error creating node pool: {e}")
+                logger.error("Error creating node pool: %s", describe_error(e))
                 return f"Failed to create node pool '{node_pool_name}' in GKE cluster '{cluster_name}': {str(e)}"
         
         # Delete node pool tool
@@ -462,26 +459,23 @@ class GKETools:
             """
             try:
                 # Check if cluster exists
-                cluster = self.gke_service.get_cluster(cluster_name, location)
+                cluster, node_pools = await asyncio.to_thread(self.gke_service.get_cluster_with_node_pools, cluster_name, location)
                 if not cluster:
                     return f"GKE cluster '{cluster_name}' not found in location {location}."
                 
                 if cluster.autopilot:
                     return f"Cluster '{cluster_name}' is an Autopilot cluster, which does not have user-manageable node pools."
                 
-                # Check if node pool exists by listing node pools
-                node_pools = self.gke_service.list_node_pools(cluster_name, location)
-                node_pool_names = [pool.name for pool in node_pools]
-                
-                if node_pool_name not in node_pool_names:
+                # Check if node pool exists
+                if not any(pool.name == node_pool_name for pool in node_pools):
                     return f"Node pool '{node_pool_name}' not found in GKE cluster '{cluster_name}'."
                 
                 # Delete the node pool
-                result = self.gke_service.delete_node_pool(cluster_name, location, node_pool_name)
+                result = await asyncio.to_thread(self.gke_service.delete_node_pool, cluster_name, location, node_pool_name)
                 
                 return f"Deleting node pool '{node_pool_name}' from GKE cluster '{cluster_name}'. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error deleting node pool: {e}")
+                logger.error("Error deleting node pool: %s", describe_error(e))
                 return f"Failed to delete node pool '{node_pool_name}' from GKE cluster '{cluster_name}': {str(e)}"
         
         # Resize node pool tool
@@ -498,29 +492,25 @@ class GKETools:
             """
             try:
                 # Check if cluster exists
-                cluster = self.gke_service.get_cluster(cluster_name, location)
+                cluster, node_pools = await asyncio.to_thread(self.gke_service.get_cluster_with_node_pools, cluster_name, location)
                 if not cluster:
                     return f"GKE cluster '{cluster_name}' not found in location {location}."
                 
                 if cluster.autopilot:
                     return f"Cluster '{cluster_name}' is an Autopilot cluster, which does not have user-manageable node pools."
                 
-                # Check if node pool exists by listing node pools
-                node_pools = self.gke_service.list_node_pools(cluster_name, location)
-                node_pool_names = [pool.name for pool in node_pools]
-                
-                if node_pool_name not in node_pool_names:
+                # Check if node pool exists, and whether autoscaling is enabled
+                node_pool = next((pool for pool in node_pools if pool.name == node_pool_name), None)
+                if node_pool is None:
                     return f"Node pool '{node_pool_name}' not found in GKE cluster '{cluster_name}'."
                 
-                # Find the node pool to check if autoscaling is enabled
-                node_pool = next((pool for pool in node_pools if pool.name == node_pool_name), None)
-                if node_pool and node_pool.autoscaling_enabled:
+                if node_pool.autoscaling_enabled:
                     return f"Node pool '{node_pool_name}' has autoscaling enabled. To resize, disable autoscaling first."
                 
                 # Resize the node pool
-                result = self.gke_service.resize_node_pool(cluster_name, location, node_pool_name, node_count)
+                result = await asyncio.to_thread(self.gke_service.resize_node_pool, cluster_name, location, node_pool_name, node_count)
                 
                 return f"Resizing node pool '{node_pool_name}' in GKE cluster '{cluster_name}' to {node_count} nodes. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error resizing node pool: {e}")
+                logger.error("Error resizing node pool: %s", describe_error(e))
                 return f"Failed to resize node pool '{node_pool_name}' in GKE cluster '{cluster_name}': {str(e)}"
\ No newline at end of file
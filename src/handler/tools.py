@@ -6,11 +6,34 @@ import logging
 import asyncio
 from typing import Dict, List, Optional, Any
 
+from googleapiclient.errors import HttpError
 from src.core.instance import GCPService
-from src.models.models import GCPInstance
+from src.core.transport import describe_error
+from src.models.models import GCPInstance, GCPOperationResult
 
 logger = logging.getLogger(__name__)
 
+
+def _summarize_operations(action: str, zone: str, names: List[str], results: List[GCPOperationResult]) -> str:
+    """
+    Summarize a batch of instance operations as one line per instance.
+    
+    Args:
+        action: Verb for the started operations (e.g. "Creating")
+        zone: Zone of the instances
+        names: Instance names, in the same order as results
+        results: The operation result for each instance
+    """
+    failed = sum(result.status == 'ERROR' for result in results)
+    parts = [f"{action} {len(names) - failed} of {len(names)} instances in zone {zone}:\n"]
+    for name, result in zip(names, results):
+        if result.status == 'ERROR':
+            parts.append(f"- {name}: failed: {(result.error or {}).get('message', '')}\n")
+        else:
+            parts.append(f"- {name}: Operation: {result.name}, Status: {result.status}\n")
+    return "".join(parts)
+
+
 class GCPTools:
     """
     Collection of GCP instance management tools for MCP.
@@ -39,22 +62,65 @@ class GCPTools:
             Args:
                 zone: The zone to list instances from (e.g., us-central1-a)
             """
+            def format_rows() -> List[str]:
+                # Format each page as it arrives; the pages stay in the service's list cache
+                rows = []
+                page_token = None
+                while True:
+                    instance_list = self.gcp_service.list_instances(zone, page_token)
+                    rows.extend(
+                        f"- {instance.name} ({instance.machine_type}): {instance.status}\n"
+                        for instance in instance_list.instances
+                    )
+                    page_token = instance_list.next_page_token
+                    if page_token is None:
+                        return rows
+            
             try:
-                instance_list = self.gcp_service.list_instances(zone)
+                rows = await asyncio.to_thread(format_rows)
                 
-                if not instance_list.instances:
+                if not rows:
                     return f"No instances found in zone {zone}."
                 
-                # Format the response
-                result = f"Instances in zone {zone}:\n\n"
-                for instance in instance_list.instances:
-                    result += f"- {instance.name} ({instance.machine_type}): {instance.status}\n"
-                
-                return result
+                return f"Instances in zone {zone}:\n\n" + "".join(rows)
             except Exception as e:
-                logger.error(f"Error listing instances: {e}")
+                logger.error("Error listing instances: %s", describe_error(e))
                 return f"Failed to list instances in zone {zone}: {str(e)}"
         
+        # List instances across zones tool
+        @self.mcp.tool()
+        async def list_instances_all_zones(zones: Optional[List[str]] = None) -> str:
+            """
+            List GCP instances in several zones at once.
+            
+            Args:
+                zones: The zones to list instances from (e.g., ["us-central1-a", "europe-west1-b"]);
+                    all of the project's zones if omitted
+            """
+            try:
+                if zones is None:
+                    zones = await asyncio.to_thread(self.gcp_service.list_zones)
+                
+                # The service queries the zones concurrently with bounded parallelism
+                instance_lists = await asyncio.to_thread(self.gcp_service.list_all_zones, zones)
+                
+                parts = []
+                for zone, instance_list in instance_lists.items():
+                    if not instance_list.instances:
+                        parts.append(f"No instances found in zone {zone}.\n\n")
+                        continue
+                    parts.append(f"Instances in zone {zone}:\n\n")
+                    parts.extend(
+                        f"- {instance.name} ({instance.machine_type}): {instance.status}\n"
+                        for instance in instance_list.instances
+                    )
+                    parts.append("\n")
+                
+                return "".join(parts) or "No zones specified."
+            except Exception as e:
+                logger.error("Error listing instances across zones: %s", describe_error(e))
+                return f"Failed to list instances across zones: {str(e)}"
+        
         # Get instance details tool
         @self.mcp.tool()
         async def get_instance(name: str, zone: str) -> str:
@@ -66,57 +132,64 @@ class GCPTools:
                 zone: The zone where the instance is located
             """
             try:
-                instance = self.gcp_service.get_instance(zone, name)
+                instance = await asyncio.to_thread(self.gcp_service.get_instance, zone, name)
                 
                 if not instance:
                     return f"Instance '{name}' not found in zone {zone}."
                 
                 # Format the response
-                result = f"Instance Details: {instance.name}\n"
-                result += f"  Zone: {zone}\n"
-                result += f"  Machine Type: {instance.machine_type}\n"
-                result += f"  Status: {instance.status}\n"
+                parts = [
+                    f"Instance Details: {instance.name}\n"
+                    f"  Zone: {zone}\n"
+                    f"  Machine Type: {instance.machine_type}\n"
+                    f"  Status: {instance.status}\n"
+                ]
                 
                 # Add network information
                 if instance.network_interfaces:
-                    result += "  Network Interfaces:\n"
+                    parts.append("  Network Interfaces:\n")
                     for ni in instance.network_interfaces:
-                        result += f"    - Network: {ni.get('network', '').split('/')[-1]}\n"
-                        result += f"      IP: {ni.get('networkIP', '')}\n"
+                        parts.append(
+                            f"    - Network: {ni.get('network', '').rpartition('/')[2]}\n"
+                            f"      IP: {ni.get('networkIP', '')}\n"
+                        )
                         
                         # Add access configs (external IPs)
-                        for ac in ni.get('accessConfigs', []):
-                            if 'natIP' in ac:
-                                result += f"      External IP: {ac.get('natIP', '')}\n"
+                        parts.extend(
+                            f"      External IP: {ac['natIP']}\n"
+                            for ac in ni.get('accessConfigs', []) if 'natIP' in ac
+                        )
                 
                 # Add disk information
                 if instance.disks:
-                    result += "  Disks:\n"
-                    for disk in instance.disks:
-                        disk_name = disk.get('source', '').split('/')[-1]
-                        result += f"    - {disk_name} (Boot: {disk.get('boot', False)})\n"
+                    parts.append("  Disks:\n")
+                    parts.extend(
+                        f"    - {disk.get('source', '').rpartition('/')[2]} (Boot: {disk.get('boot', False)})\n"
+                        for disk in instance.disks
+                    )
                 
                 # Add labels if present
                 if instance.labels:
-                    result += "  Labels:\n"
-                    for k, v in instance.labels.items():
-                        result += f"    - {k}: {v}\n"
+                    parts.append("  Labels:\n")
+                    parts.extend(f"    - {k}: {v}\n" for k, v in instance.labels.items())
                 
                 # Add metadata if present
                 if instance.metadata and 'items' in instance.metadata:
-                    result += "  Metadata:\n"
-                    for item in instance.metadata.get('items', []):
-                        result += f"    - {item.get('key')}: {item.get('value')}\n"
+                    parts.append("  Metadata:\n")
+                    parts.extend(
+                        f"    - {item.get('key')}: {item.get('value')}\n"
+                        for item in instance.metadata.get('items', [])
+                    )
                 
-                return result
+                return "".join(parts)
             except Exception as e:
-                logger.error(f"Error getting instance details: {e}")
+                logger.error("Error getting instance details: %s", describe_error(e))
                 return f"Failed to get details for instance '{name}' in zone {zone}: {str(e)}"
         
         # Create instance tool
         @self.mcp.tool()
         async def create_instance(
-            name: str, 
+            name: str,
             zone: str,
             machine_type: str = "n1-standard-1",
             labels: Optional[Dict[str, str]] = None,
@@ -139,34 +212,72 @@ class GCPTools:
                 metadata: Metadata configuration
             """
             try:
-                # Handle None values
-                labels = labels or {}
-                
-                # Create instance object
+                # Create instance object; omitted settings fall back to the model defaults
                 instance = GCPInstance(
                     name=name,
                     machine_type=machine_type,
                     zone=zone,
-                    labels=labels,
+                    labels=labels or {},
                     source_image=source_image,
-                    network_interfaces=network_interfaces,
-                    disks=disks,
-                    metadata=metadata
+                    network_interfaces=network_interfaces or [],
+                    disks=disks or [],
+                    metadata=metadata or {}
                 )
                 
                 # Check if instance already exists
-                existing = self.gcp_service.get_instance(zone, name)
+                existing = await asyncio.to_thread(self.gcp_service.get_instance, zone, name)
                 if existing:
                     return f"Instance '{name}' already exists in zone {zone}."
                 
                 # Create the instance
-                result = self.gcp_service.create_instance(instance)
+                result = await asyncio.to_thread(self.gcp_service.create_instance, instance)
                 
                 return f"Creating instance '{name}' in zone {zone}. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error creating instance: {e}")
+                logger.error("Error creating instance: %s", describe_error(e))
                 return f"Failed to create instance '{name}' in zone {zone}: {str(e)}"
         
+        # Create instances tool
+        @self.mcp.tool()
+        async def create_instances(
+            names: List[str],
+            zone: str,
+            machine_type: str = "n1-standard-1",
+            labels: Optional[Dict[str, str]] = None,
+            source_image: str = "projects/debian-cloud/global/images/family/debian-10"
+        ) -> str:
+            """
+            Create several GCP instances with the same configuration.
+            
+            Args:
+                names: Names for the new instances
+                zone: Zone to create the instances in
+                machine_type: Machine type (e.g., n1-standard-1)
+                labels: Labels to attach to every instance (e.g., {"env": "prod"})
+                source_image: Source image to use for the instances
+            """
+            if not names:
+                return "No instance names specified."
+            try:
+                instances = [
+                    GCPInstance(
+                        name=name,
+                        machine_type=machine_type,
+                        zone=zone,
+                        labels=labels or {},
+                        source_image=source_image
+                    )
+                    for name in names
+                ]
+                
+                # All inserts go out in batched requests instead of one call per instance
+                results = await asyncio.to_thread(self.gcp_service.create_instances, instances)
+                
+                return _summarize_operations("Creating", zone, names, results)
+            except Exception as e:
+                logger.error("Error creating instances: %s", describe_error(e))
+                return f"Failed to create instances in zone {zone}: {str(e)}"
+        
         # Delete instance tool
         @self.mcp.tool()
         async def delete_instance(name: str, zone: str) -> str:
@@ -178,19 +289,39 @@ class GCPTools:
                 zone: Zone where the instance is located
             """
             try:
-                # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
-                if not existing:
-                    return f"Instance '{name}' not found in zone {zone}."
-                
-                # Delete the instance
-                result = self.gcp_service.delete_instance(zone, name)
+                # Delete the instance; a missing instance is reported by the API itself
+                try:
+                    result = await asyncio.to_thread(self.gcp_service.delete_instance, zone, name)
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        return f"Instance '{name}' not found in zone {zone}."
+                    raise
                 
                 return f"Deleting instance '{name}' in zone {zone}. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error deleting instance: {e}")
+                logger.error("Error deleting instance: %s", describe_error(e))
                 return f"Failed to delete instance '{name}' in zone {zone}: {str(e)}"
         
+        # Delete instances tool
+        @self.mcp.tool()
+        async def delete_instances(names: List[str], zone: str) -> str:
+            """
+            Delete several GCP instances.
+            
+            Args:
+                names: Names of the instances to delete
+                zone: Zone where the instances are located
+            """
+            if not names:
+                return "No instance names specified."
+            try:
+                results = await asyncio.to_thread(self.gcp_service.delete_instances, zone, names)
+                
+                return _summarize_operations("Deleting", zone, names, results)
+            except Exception as e:
+                logger.error("Error deleting instances: %s", describe_error(e))
+                return f"Failed to delete instances in zone {zone}: {str(e)}"
+        
         # Start instance tool
         @self.mcp.tool()
         async def start_instance(name: str, zone: str) -> str:
@@ -202,21 +333,22 @@ class GCPTools:
                 zone: Zone where the instance is located
             """
             try:
-                # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
-                if not existing:
-                    return f"Instance '{name}' not found in zone {zone}."
-                
-                # Check if instance is already running
-                if existing.status == "RUNNING":
+                # Check if instance is already running, when a recent read says so
+                existing = self.gcp_service.cached_instance(zone, name)
+                if existing is not None and existing.status == "RUNNING":
                     return f"Instance '{name}' is already running."
                 
-                # Start the instance
-                result = self.gcp_service.start_instance(zone, name)
+                # Start the instance; a missing instance is reported by the API itself
+                try:
+                    result = await asyncio.to_thread(self.gcp_service.start_instance, zone, name)
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        return f"Instance '{name}' not found in zone {zone}."
+                    raise
                 
                 return f"Starting instance '{name}' in zone {zone}. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error starting instance: {e}")
+                logger.error("Error starting instance: %s", describe_error(e))
                 return f"Failed to start instance '{name}' in zone {zone}: {str(e)}"
         
         # Stop instance tool
@@ -230,21 +362,22 @@ class GCPTools:
                 zone: Zone where the instance is located
             """
             try:
-                # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
-                if not existing:
-                    return f"Instance '{name}' not found in zone {zone}."
-                
-                # Check if instance is already stopped
-                if existing.status == "TERMINATED":
+                # Check if instance is already stopped, when a recent read says so
+                existing = self.gcp_service.cached_instance(zone, name)
+                if existing is not None and existing.status == "TERMINATED":
                     return f"Instance '{name}' is already stopped."
                 
-                # Stop the instance
-                result = self.gcp_service.stop_instance(zone, name)
+                # Stop the instance; a missing instance is reported by the API itself
+                try:
+                    result = await asyncio.to_thread(self.gcp_service.stop_instance, zone, name)
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        return f"Instance '{name}' not found in zone {zone}."
+                    raise
                 
                 return f"Stopping instance '{name}' in zone {zone}. Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error stopping instance: {e}")
+                logger.error("Error stopping instance: %s", describe_error(e))
                 return f"Failed to stop instance '{name}' in zone {zone}: {str(e)}"
         
         # Modify instance tool
@@ -271,39 +404,47 @@ class GCPTools:
                 metadata: New metadata to set
             """
             try:
-                # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
-                if not existing:
-                    return f"Instance '{name}' not found in zone {zone}."
-                
-                # Modify the instance
-                result = self.gcp_service.modify_instance(
-                    zone=zone,
-                    name=name,
-                    machine_type=machine_type,
-                    network_interfaces=network_interfaces,
-                    disks=disks,
-                    labels=labels,
-                    metadata=metadata
-                )
+                # A labels-only change that a recent read shows is already applied needs no call
+                if (labels is not None and machine_type is None and network_interfaces is None
+                        and disks is None and metadata is None):
+                    existing = self.gcp_service.cached_instance(zone, name)
+                    if existing is not None and existing.labels == labels:
+                        return f"Labels of instance '{name}' already match; no update performed."
+                
+                # Modify the instance; a missing instance is reported by the API itself
+                try:
+                    result = await asyncio.to_thread(
+                        self.gcp_service.modify_instance,
+                        zone=zone,
+                        name=name,
+                        machine_type=machine_type,
+                        network_interfaces=network_interfaces,
+                        disks=disks,
+                        labels=labels,
+                        metadata=metadata
+                    )
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        return f"Instance '{name}' not found in zone {zone}."
+                    raise
                 
                 # Format response
-                result_str = f"Modifying instance '{name}' in zone {zone}.\n"
+                parts = [f"Modifying instance '{name}' in zone {zone}.\n"]
                 if machine_type:
-                    result_str += f"  - Machine Type: {machine_type}\n"
+                    parts.append(f"  - Machine Type: {machine_type}\n")
                 if network_interfaces:
-                    result_str += "  - Network Interfaces: Updated\n"
+                    parts.append("  - Network Interfaces: Updated\n")
                 if disks:
-                    result_str += "  - Disks: Updated\n"
+                    parts.append("  - Disks: Updated\n")
                 if labels:
-                    result_str += "  - Labels: Updated\n"
+                    parts.append("  - Labels: Updated\n")
                 if metadata:
-                    result_str += "  - Metadata: Updated\n"
-                result_str += f"Operation: {result.name}, Status: {result.status}"
+                    parts.append("  - Metadata: Updated\n")
+                parts.append(f"Operation: {result.name}, Status: {result.status}")
                 
-                return result_str
+                return "".join(parts)
             except Exception as e:
-                logger.error(f"Error modifying instance: {e}")
+                logger.error("Error modifying instance: %s", describe_error(e))
                 return f"Failed to modify instance '{name}' in zone {zone}: {str(e)}"
         
         @self.mcp.tool()
@@ -316,24 +457,21 @@ class GCPTools:
                 zone: Zone where the instance is located
             """
             try:
-                # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
-                if not existing:
-                    return f"Instance '{name}' not found in zone {zone}."
-                
-                # First stop the instance
-                stop_result = self.gcp_service.stop_instance(zone, name)
-                
-                # Wait for the instance to stop (in production, would use GCP operation polling)
-                # For simplicity, we're just waiting a fixed amount of time
-                await asyncio.sleep(10)
+                # First stop the instance and wait for the stop operation to finish;
+                # a missing instance is reported by the API itself
+                try:
+                    stop_result = await asyncio.to_thread(self.gcp_service.stop_instance, zone, name, wait=True)
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        return f"Instance '{name}' not found in zone {zone}."
+                    raise
                 
                 # Then start the instance
-                start_result = self.gcp_service.start_instance(zone, name)
+                start_result = await asyncio.to_thread(self.gcp_service.start_instance, zone, name)
                 
                 return f"Restarting instance '{name}' in zone {zone}. Stop operation: {stop_result.name}, Start operation: {start_result.name}"
             except Exception as e:
-                logger.error(f"Error restarting instance: {e}")
+                logger.error("Error restarting instance: %s", describe_error(e))
                 return f"Failed to restart instance '{name}' in zone {zone}: {str(e)}"
         
         @self.mcp.tool()
@@ -360,7 +498,7 @@ class GCPTools:
             """
             try:
                 # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
+                existing = await asyncio.to_thread(self.gcp_service.get_instance, zone, name)
                 if not existing:
                     return f"Instance '{name}' not found in zone {zone}."
                 
@@ -374,13 +512,13 @@ class GCPTools:
                 }
                 
                 # Add the disk
-                result = self.gcp_service.add_disk(zone, name, disk_config)
+                result = await asyncio.to_thread(self.gcp_service.add_disk, zone, name, disk_config)
                 
                 return f"Adding disk '{disk_name}' to instance '{name}' in zone {zone}.\n" \
                        f"Size: {size_gb}GB, Type: {disk_type}, Mode: {mode}\n" \
                        f"Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error adding disk: {e}")
+                logger.error("Error adding disk: %s", describe_error(e))
                 return f"Failed to add disk to instance '{name}' in zone {zone}: {str(e)}"
         
         @self.mcp.tool()
@@ -403,12 +541,13 @@ class GCPTools:
             """
             try:
                 # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
+                existing = await asyncio.to_thread(self.gcp_service.get_instance, zone, name)
                 if not existing:
                     return f"Instance '{name}' not found in zone {zone}."
                 
                 # Modify the disk
-                result = self.gcp_service.modify_disk(
+                result = await asyncio.to_thread(
+                    self.gcp_service.modify_disk,
                     zone=zone,
                     name=name,
                     disk_name=disk_name,
@@ -417,16 +556,16 @@ class GCPTools:
                 )
                 
                 # Format response
-                result_str = f"Modifying disk '{disk_name}' on instance '{name}' in zone {zone}.\n"
+                parts = [f"Modifying disk '{disk_name}' on instance '{name}' in zone {zone}.\n"]
                 if size_gb:
-                    result_str += f"  - New size: {size_gb}GB\n"
+                    parts.append(f"  - New size: {size_gb}GB\n")
                 if disk_type:
-                    result_str += f"  - New type: {disk_type}\n"
-                result_str += f"Operation: {result.name}, Status: {result.status}"
+                    parts.append(f"  - New type: {disk_type}\n")
+                parts.append(f"Operation: {result.name}, Status: {result.status}")
                 
-                return result_str
+                return "".join(parts)
             except Exception as e:
-                logger.error(f"Error modifying disk: {e}")
+                logger.error("Error modifying disk: %s", describe_error(e))
                 return f"Failed to modify disk on instance '{name}' in zone {zone}: {str(e)}"
         
         @self.mcp.tool()
@@ -449,12 +588,13 @@ class GCPTools:
             """
             try:
                 # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
+                existing = await asyncio.to_thread(self.gcp_service.get_instance, zone, name)
                 if not existing:
                     return f"Instance '{name}' not found in zone {zone}."
                 
                 # Attach the disk
-                result = self.gcp_service.attach_disk(
+                result = await asyncio.to_thread(
+                    self.gcp_service.attach_disk,
                     zone=zone,
                     name=name,
                     disk_name=disk_name,
@@ -466,7 +606,7 @@ class GCPTools:
                        f"Mode: {mode}, Auto-delete: {auto_delete}\n" \
                        f"Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error attaching disk: {e}")
+                logger.error("Error attaching disk: %s", describe_error(e))
                 return f"Failed to attach disk to instance '{name}' in zone {zone}: {str(e)}"
         
         @self.mcp.tool()
@@ -485,12 +625,13 @@ class GCPTools:
             """
             try:
                 # Check if instance exists
-                existing = self.gcp_service.get_instance(zone, name)
+                existing = await asyncio.to_thread(self.gcp_service.get_instance, zone, name)
                 if not existing:
                     return f"Instance '{name}' not found in zone {zone}."
                 
                 # Detach the disk
-                result = self.gcp_service.detach_disk(
+                result = await asyncio.to_thread(
+                    self.gcp_service.detach_disk,
                     zone=zone,
                     name=name,
                     device_name=device_name
@@ -499,5 +640,5 @@ class GCPTools:
                 return f"Detaching disk '{device_name}' from instance '{name}' in zone {zone}.\n" \
                        f"Operation: {result.name}, Status: {result.status}"
             except Exception as e:
-                logger.error(f"Error detaching disk: {e}")
+                logger.error("Error detaching disk: %s", describe_error(e))
                 return f"Failed to detach disk from instance '{name}' in zone {zone}: {str(e)}"
\ No newline at end of file
@@ -33,7 +33,7 @@ class NodePool(BaseModel):
 class GKECluster(BaseModel):
     """Model representing a GKE cluster."""
     name: str
-    location: str = Field(default_factory=lambda: GCP_REGION)
+    location: str = GCP_REGION
     location_type: Literal["zonal", "regional"] = "regional"
     autopilot: bool = False
     node_pools: List[NodePool] = Field(default_factory=list)
@@ -12,7 +12,7 @@ class GCPInstance(BaseModel):
     """Model representing a GCP instance."""
     name: str
     machine_type: str = "n1-standard-1"
-    zone: str = Field(default_factory=lambda: GCP_ZONE)
+    zone: str = GCP_ZONE
     status: Optional[str] = None
     network_interfaces: List[Dict[str, Any]] = Field(default_factory=list)
     disks: List[Dict[str, Any]] = Field(default_factory=list)
@@ -22,6 +22,8 @@ class GCPInstance(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        # Instances are shared through the service caches, so they must not change
+        frozen = True
 
 
 class GCPInstanceList(BaseModel):
@@ -29,6 +31,11 @@ class GCPInstanceList(BaseModel):
     instances: List[GCPInstance] = Field(default_factory=list)
     next_page_token: Optional[str] = None
 
+    class Config:
+        frozen = True
+        # Instances in the list are already models; reuse them instead of revalidating
+        revalidate_instances = 'never'
+
 
 class GCPOperationResult(BaseModel):
     """Model representing a GCP operation result."""
@@ -36,4 +43,7 @@ class GCPOperationResult(BaseModel):
     status: str
     operation_type: str
     target_id: Optional[str] = None
-    error: Optional[Dict[str, Any]] = None
\ No newline at end of file
+    error: Optional[Dict[str, Any]] = None
+
+    class Config:
+        frozen = True
\ No newline at end of file
@@ -10,6 +10,31 @@ GCP_CREDENTIALS_PATH = os.getenv("GCP_CREDENTIALS_PATH", "credentials.json")
 GCP_REGION = os.getenv("GCP_REGION", "us-central1")
 GCP_ZONE = os.getenv("GCP_ZONE", f"{GCP_REGION}-a")
 
+# API request pacing
+# Requests per second allowed across all Google API clients (0 disables the limit)
+GCP_API_QPS = float(os.getenv("GCP_API_QPS", "25"))
+# Retries, with exponential backoff and jitter, for 429 and 5xx responses to
+# reads and operation waits (mutations are not retried)
+GCP_API_NUM_RETRIES = int(os.getenv("GCP_API_NUM_RETRIES", "4"))
+# Socket timeout in seconds for each API request; covers zoneOperations.wait's
+# roughly two-minute server-side wait with room to spare
+GCP_API_TIMEOUT = float(os.getenv("GCP_API_TIMEOUT", "180"))
+
+# API response handling
+# Build models from API responses without pydantic validation (set to "false" to validate)
+TRUST_GCP_RESPONSES = os.getenv("TRUST_GCP_RESPONSES", "true").lower() in ("1", "true", "yes")
+
+# Compute Engine Configuration
+# Seconds that instance reads and zone listings are served from cache (0 disables caching)
+GCP_INSTANCE_CACHE_TTL = float(os.getenv("GCP_INSTANCE_CACHE_TTL", "5"))
+GCP_LIST_CACHE_TTL = float(os.getenv("GCP_LIST_CACHE_TTL", "2"))
+# Seconds that the project's zone names are served from cache
+GCP_ZONES_CACHE_TTL = float(os.getenv("GCP_ZONES_CACHE_TTL", "3600"))
+
+# GKE Configuration
+# Seconds that cluster and node pool reads are served from cache (0 disables caching)
+GKE_CACHE_TTL = float(os.getenv("GKE_CACHE_TTL", "30"))
+
 # MCP Server Configuration
 MCP_HOST = os.getenv("MCP_HOST", "0.0.0.0")
 MCP_PORT = int(os.getenv("MCP_PORT", "8000"))
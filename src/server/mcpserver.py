@@ -8,6 +8,7 @@ from mcp.server.fastmcp import FastMCP
 # Import from local modules
 from src.server.config import MCP_HOST, MCP_PORT, GCP_PROJECT_ID, GCP_CREDENTIALS_PATH  
 from src.core.instance import GCPService
+from src.core.transport import describe_error
 from src.handler.tools import GCPTools
 from src.handler.gke_tools import GKETools
 from src.core.gke_service import GKEService
@@ -56,16 +57,16 @@ class MCPServer:
             # Initialize GCP service
             self.gcp_service.initialize()
             
-            # Initialize GKE service
-            self.gke_service.initialize()
+            # The GKE service initializes itself on the first GKE tool call, so
+            # servers used only for instances never build the Container client
             
             # Register tools with MCP
             self.gcp_tools = GCPTools(self.gcp_service, self.mcp)
             self.gke_tools = GKETools(self.gke_service, self.mcp)
             
-            logger.info(f"MCP server setup complete with tools registered")
+            logger.info("MCP server setup complete with tools registered")
         except Exception as e:
-            logger.error(f"Error setting up MCP server: {e}")
+            logger.error("Error setting up MCP server: %s", describe_error(e))
             raise
     
     def run(self, transport='stdio', transport_args=None):
@@ -91,10 +92,10 @@ class MCPServer:
                     }
             
             # Log transport information
-            transport_info = f"{transport}"
             if transport_args:
-                transport_info += f" with args: {transport_args}"
-            logger.info(f"Starting MCP server with {transport_info}")
+                logger.info("Starting MCP server with %s with args: %s", transport, transport_args)
+            else:
+                logger.info("Starting MCP server with %s", transport)
             
             # Run the MCP server with the specified transport
             if transport_args:
@@ -103,5 +104,5 @@ class MCPServer:
                 self.mcp.run(transport=transport)
                 
         except Exception as e:
-            logger.error(f"Error running MCP server: {e}")
+            logger.error("Error running MCP server: %s", describe_error(e))
             raise
\ No newline at end of file